@@ -6,28 +6,65 @@ This script generates the website and prepares it for deployment to GitHub Pages
 It creates a deployment-ready directory that can be easily pushed to GitHub.
 """
 
-import subprocess
+import os
 import sys
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+from website_generator import main as generate_website
 
-def run_command(command, description):
-    """Run a command and handle errors."""
-    print(f"\n🔄 {description}...")
+# The deployed site doesn't need file metadata, and on Linux/macOS copyfile
+# copies in-kernel (sendfile/fcopyfile). On Windows copy2 takes the native
+# CopyFile2 fast path instead.
+copy_file = shutil.copy2 if sys.platform == "win32" else shutil.copyfile
+
+
+def run_step(step, description):
+    """Run a step in-process and handle errors."""
+    print(f"\n🔄 {description}...", flush=True)
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        step()
         print(f"✅ {description} completed successfully")
-        if result.stdout:
-            print(result.stdout)
         return True
-    except subprocess.CalledProcessError as e:
+    except Exception as e:
         print(f"❌ {description} failed:")
-        print(f"Error: {e.stderr}")
+        print(f"Error: {e}")
         return False
 
 
+def link_or_copy(src, dst):
+    """Hardlink src to dst, copying instead if the filesystem refuses."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        copy_file(src, dst)
+
+
+def copy_tree_parallel(src_dir, dst_dir):
+    """Copy every file under src_dir into dst_dir using a thread pool."""
+    files = [(path, dst_dir / path.relative_to(src_dir))
+             for path in src_dir.rglob('*') if path.is_file()]
+    
+    # Create all target directories up front so the workers only copy
+    for parent in {dst.parent for _, dst in files}:
+        parent.mkdir(parents=True, exist_ok=True)
+    
+    # On the same filesystem a hardlink is a single inode update, no matter
+    # how large the file is. The website generator replaces its output files
+    # (write_file_atomic) rather than writing through them, so later builds
+    # never change the linked copies in deploy/.
+    if os.stat(src_dir).st_dev == os.stat(dst_dir).st_dev:
+        transfer = link_or_copy
+    else:
+        transfer = copy_file
+    
+    # File copies release the GIL, so threads overlap the I/O
+    with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 4) as executor:
+        list(executor.map(lambda pair: transfer(*pair), files))
+
+
 def main():
     """Main deployment function."""
     print("🚀 SpydirWebz Deployment Script")
@@ -40,7 +77,7 @@ def main():
         sys.exit(1)
     
     # Step 1: Generate the website
-    if not run_command("python website_generator.py", "Generating website"):
+    if not run_step(generate_website, "Generating website"):
         print("\n❌ Website generation failed. Stopping.")
         sys.exit(1)
     
@@ -53,11 +90,7 @@ def main():
     # Step 3: Copy website files to deployment directory
     website_dir = Path("website")
     if website_dir.exists():
-        for item in website_dir.iterdir():
-            if item.is_file():
-                shutil.copy2(item, deploy_dir)
-            elif item.is_dir():
-                shutil.copytree(item, deploy_dir / item.name)
+        copy_tree_parallel(website_dir, deploy_dir)
         print("✅ Copied website files to deploy/ directory")
     else:
         print("❌ Website directory not found!")
@@ -98,18 +131,25 @@ To update the website with new puzzles:
 Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 """
     
-    with open(deploy_dir / "README.md", 'w', encoding='utf-8') as f:
-        f.write(deploy_readme)
+    # deploy/README.md may be a hardlink to website/README.md; replace the
+    # link rather than writing through it
+    readme_path = deploy_dir / "README.md"
+    try:
+        readme_path.unlink()
+    except FileNotFoundError:
+        pass
+    readme_path.write_text(deploy_readme, encoding='utf-8')
     
     print("✅ Created deployment README")
     
     print(f"\n🎉 Deployment package ready in {deploy_dir}/")
     print("\n📁 Files ready for deployment:")
-    for item in deploy_dir.iterdir():
-        if item.is_file():
-            print(f"   📄 {item.name}")
-        elif item.is_dir():
-            print(f"   📁 {item.name}/")
+    with os.scandir(deploy_dir) as entries:
+        for entry in entries:
+            if entry.is_file():
+                print(f"   📄 {entry.name}")
+            elif entry.is_dir():
+                print(f"   📁 {entry.name}/")
     
     print("\n🚀 Next steps:")
     print("   1. Create a new GitHub repository")
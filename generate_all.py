@@ -4,30 +4,78 @@ SpydirWebz All-in-One Generator
 
 This script creates a new puzzle and then generates the website in one command.
 Perfect for quickly creating and deploying new puzzles.
+
+Run with --watch to keep creating puzzles; the website for each new puzzle is
+rebuilt in the background while the next one is being created.
 """
 
-import subprocess
+import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from puzzle_creator import PuzzleManager, main as create_puzzle
+from website_generator import main as generate_website
+
 
-def run_command(command, description):
-    """Run a command and handle errors."""
-    print(f"\n🔄 {description}...")
+def run_step(step, description):
+    """Run a step in-process and handle errors."""
+    print(f"\n🔄 {description}...", flush=True)
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        step()
         print(f"✅ {description} completed successfully")
-        if result.stdout:
-            print(result.stdout)
         return True
-    except subprocess.CalledProcessError as e:
+    except Exception as e:
         print(f"❌ {description} failed:")
-        print(f"Error: {e.stderr}")
+        print(f"Error: {e}")
         return False
 
 
+def rebuild_website_quietly(puzzle_number):
+    """Rebuild the website without progress output, then report in one line.
+
+    Runs in the background while the next puzzle's prompts are waiting for
+    input, so it must not print the full build log over them.
+    """
+    try:
+        generate_website(verbose=False)
+    except Exception as e:
+        print(f"\n❌ Background website build failed: {e}")
+    else:
+        print(f"\n✅ Website rebuilt with puzzle #{puzzle_number}")
+
+
+def watch():
+    """Create puzzles continuously, rebuilding the website in the background."""
+    print("👀 Watch mode - press Ctrl+C at a prompt to stop")
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        site_build = None
+        while True:
+            next_number = PuzzleManager.get_next_puzzle_number()
+            run_step(create_puzzle, "Creating new puzzle")
+            if PuzzleManager.get_next_puzzle_number() == next_number:
+                # No puzzle was saved (cancelled or failed), so stop watching
+                break
+            
+            # Render the site for this puzzle while the next one is created
+            if site_build is not None:
+                site_build.result()
+            site_build = executor.submit(rebuild_website_quietly, next_number)
+        
+        if site_build is not None:
+            site_build.result()
+    
+    print("\n🎉 Watch mode finished. Your puzzles and website are ready.")
+
+
 def main():
     """Main function to generate puzzle and website."""
+    parser = argparse.ArgumentParser(description="Create a puzzle and regenerate the website.")
+    parser.add_argument("--watch", action="store_true",
+                        help="keep creating puzzles, rebuilding the website in the background")
+    args = parser.parse_args()
+    
     print("🕷️ SpydirWebz All-in-One Generator")
     print("=" * 50)
     
@@ -37,13 +85,17 @@ def main():
         print("Please run this script from the spydirwebz directory.")
         sys.exit(1)
     
+    if args.watch:
+        watch()
+        return
+    
     # Step 1: Generate a new puzzle
-    if not run_command("python puzzle_creator.py", "Creating new puzzle"):
+    if not run_step(create_puzzle, "Creating new puzzle"):
         print("\n❌ Puzzle creation failed. Stopping.")
         sys.exit(1)
     
     # Step 2: Generate the website
-    if not run_command("python website_generator.py", "Generating website"):
+    if not run_step(generate_website, "Generating website"):
         print("\n❌ Website generation failed.")
         sys.exit(1)
     
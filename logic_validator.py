@@ -1,172 +1,346 @@
 # logic_validator.py
 
+import copy
+import functools
+import hashlib
+import itertools
 import json
+import os
 import re
-from z3 import Solver, Bool, And, Or, Not, Implies, sat
 
-def validate_puzzle(puzzle: dict):
-    actors = puzzle['actors']
-    vectors = puzzle['vectors']
-    assets = puzzle['assets']
-    stolen_data_opts = puzzle['stolen_data']
-    solution = puzzle['solution']
+# Validation results keyed by a hash of the canonical puzzle JSON, so that
+# identical puzzles are only solved once per process
+_validation_cache = {}
+
+
+def _puzzle_key(puzzle: dict) -> bytes:
+    canonical = json.dumps(puzzle, sort_keys=True, default=str)
+    return hashlib.blake2b(canonical.encode('utf-8')).digest()
+
+
+@functools.lru_cache(maxsize=None)
+def _name_pattern(names: tuple) -> re.Pattern:
+    """Compile one alternation matching any of the names, longest first."""
+    alternatives = sorted(names, key=len, reverse=True)
+    return re.compile('|'.join(map(re.escape, alternatives)))
+
+
+def _find_index(pattern: re.Pattern, index: dict, text: str):
+    """Return the position of the name mentioned in text, or None."""
+    match = pattern.search(text)
+    return index.get(match.group(0)) if match else None
+
+
+def _parse_negation(text: str, ctx):
+    # Example pattern: "GhostShell did not use SQL Injection."
+    actor = _find_index(ctx.actor_re, ctx.actor_ix, text)
+    vector = _find_index(ctx.vector_re, ctx.vector_ix, text)
+    if actor is not None and vector is not None:
+        return ('negation', actor, vector, None)
+
+
+def _parse_affirmative(text: str, ctx):
+    # e.g. "Phishing was used against the Email Server."
+    vector = _find_index(ctx.vector_re, ctx.vector_ix, text)
+    asset = _find_index(ctx.asset_re, ctx.asset_ix, text)
+    if vector is not None and asset is not None:
+        return ('affirmative', None, vector, asset)
+
+
+def _parse_relational(text: str, ctx):
+    # e.g. "The actor that used SQL Injection did not access the HR Portal."
+    vector = _find_index(ctx.vector_re, ctx.vector_ix, text)
+    asset = _find_index(ctx.asset_re, ctx.asset_ix, text)
+    if vector is not None and asset is not None:
+        return ('relational', None, vector, asset)
+
+
+def _parse_conditional(text: str, ctx):
+    # e.g. "If ZeroShadow used RDP Exploit, then they accessed the Finance Database."
+    actor = _find_index(ctx.actor_re, ctx.actor_ix, text)
+    vector = _find_index(ctx.vector_re, ctx.vector_ix, text)
+    asset = _find_index(ctx.asset_re, ctx.asset_ix, text)
+    if actor is not None and vector is not None and asset is not None:
+        return ('conditional', actor, vector, asset)
+
+
+def _parse_data_inference(text: str, ctx):
+    # e.g. "Only attacks using SQL Injection resulted in theft of Source Code."
+    # This clue type is mainly for data inference validation; the actual
+    # logic constraints are handled by other clue types
+    return None
+
+
+# Clue type -> parser returning a (type, actor, vector, asset) index tuple or None
+PARSERS = {
+    'negation': _parse_negation,
+    'affirmative': _parse_affirmative,
+    'relational': _parse_relational,
+    'conditional': _parse_conditional,
+    'data-inference': _parse_data_inference,
+}
+
+
+# Grids with fewer cells than this are filtered as plain Python sets; the
+# NumPy kernel (and NumPy's import time) only pays off for much larger ones
+NUMPY_MIN_CELLS = 4096
+
+# Integer codes for the clue types that constrain the candidate grid
+CLUE_CODES = {'negation': 0, 'affirmative': 1, 'relational': 2, 'conditional': 3}
+
+
+def apply_clues(mask, kinds, actor_ix, vector_ix, asset_ix):
+    """Clear the cells of the uint8 candidate grid ruled out by each clue."""
+    for i in range(kinds.shape[0]):
+        kind = kinds[i]
+        a, v, t = actor_ix[i], vector_ix[i], asset_ix[i]
+        if kind == 0:
+            # negation: actor a did not use vector v
+            mask[a, v, :] = 0
+        elif kind == 1:
+            # affirmative: only (*, v, t) remains possible
+            keep = mask[:, v, t].copy()
+            mask[:, :, :] = 0
+            mask[:, v, t] = keep
+        elif kind == 2:
+            # relational: nobody used vector v against asset t
+            mask[:, v, t] = 0
+        elif kind == 3:
+            # conditional: actor a with vector v implies asset t
+            keep = mask[a, v, t]
+            mask[a, v, :] = 0
+            mask[a, v, t] = keep
+
+
+@functools.lru_cache(maxsize=None)
+def _clue_kernel():
+    """Return apply_clues, JIT-compiled with numba when SPYDIRWEBZ_NUMBA=1.
+
+    numba is opt-in: compiling (or loading the cached build) costs more than
+    it saves on typical grids. Without it the kernel runs as plain NumPy.
+    """
+    if os.environ.get('SPYDIRWEBZ_NUMBA') == '1':
+        try:
+            from numba import njit
+        except ImportError:
+            print("Warning: SPYDIRWEBZ_NUMBA is set but numba is not installed")
+        else:
+            return njit(cache=True)(apply_clues)
+    return apply_clues
+
+
+class PuzzleValidator:
+    """Validates puzzles that share one actor/vector/asset universe.
+
+    Solutions come from filtering the candidate triplets with the parsed
+    clues. With cross_check=True each result is also confirmed with Z3: the
+    one-hot variables and their exactly-one constraints are built once, and
+    each puzzle's clues are added inside a solver push/pop scope so the base
+    constraints (and Z3's learned clauses) are reused across puzzles.
+    """
+
+    def __init__(self, actors, vectors, assets, cross_check=False):
+        self.actors = list(actors)
+        self.vectors = list(vectors)
+        self.assets = list(assets)
+        self.actor_ix = {name: i for i, name in enumerate(self.actors)}
+        self.vector_ix = {name: i for i, name in enumerate(self.vectors)}
+        self.asset_ix = {name: i for i, name in enumerate(self.assets)}
+
+        self.actor_re = _name_pattern(tuple(actors))
+        self.vector_re = _name_pattern(tuple(vectors))
+        self.asset_re = _name_pattern(tuple(assets))
+
+        # Built on first use so that Z3 is only imported when cross-checking
+        self.cross_check = cross_check
+        self.solver = None
+
+    def _init_solver(self):
+        from z3 import Solver, Bool, PbEq
 
-    s = Solver()
+        self.solver = Solver()
 
-    # Boolean variables for each triplet possibility
-    trip_vars = {}
-    for a in actors:
-        for v in vectors:
-            for t in assets:
-                name = f'x_{a}_{v}_{t}'
-                trip_vars[(a, v, t)] = Bool(name)
+        # One-hot Boolean variables per attribute: the incident has exactly one
+        # actor, one vector and one asset
+        self.actor_is = [Bool(f'actor_{a}') for a in self.actors]
+        self.vector_is = [Bool(f'vector_{v}') for v in self.vectors]
+        self.asset_is = [Bool(f'asset_{t}') for t in self.assets]
+        for group in (self.actor_is, self.vector_is, self.asset_is):
+            self.solver.add(PbEq([(var, 1) for var in group], 1))
 
-    # Exactly one triplet must be true
-    s.add(Or(*trip_vars.values()))
-    # No two triplets can be true simultaneously
-    for t1, t2 in zip(trip_vars.values(), trip_vars.values()):
-        if t1 is not t2:
-            s.add(Not(And(t1, t2)))
+    def validate(self, puzzle: dict):
+        """Validate a puzzle whose elements match this validator's universe."""
+        parsed = self._parse_clues(puzzle['clues'])
 
-    # Constraints: if a triplet is selected, actor/vector/asset are bound
-    # (Implicitly represented by how we encode clues)
+        # Every clue is a unary/binary filter on the candidate triplets, so
+        # the triplets left over are exactly the puzzle's solutions
+        candidates = self._filter_candidates(parsed)
+        if self.cross_check:
+            self._check_with_solver(parsed, candidates)
+        return _build_result(puzzle, candidates or None)
 
-    # Encode clues:
-    for clue in puzzle['clues']:
-        text = clue['text']
-        typ = clue['type']
+    def _check_with_solver(self, parsed, candidates):
+        """Raise if Z3 disagrees with the candidate filter."""
+        if self.solver is None:
+            self._init_solver()
 
+        self.solver.push()
         try:
+            self._add_clues(parsed)
+            true_triples = self._solve()
+        finally:
+            self.solver.pop()
+
+        # _solve stops after two models, so compare up to that many
+        if true_triples is None:
+            agrees = not candidates
+        else:
+            agrees = (len(true_triples) == min(len(candidates), 2)
+                      and set(true_triples) <= set(candidates))
+        if not agrees:
+            raise RuntimeError(f"Z3 found {true_triples} but the candidate filter "
+                               f"found {candidates}")
+
+    def _parse_clues(self, clues):
+        """Resolve each clue to a (type, actor, vector, asset) index tuple."""
+        parsed = []
+        for clue in clues:
+            text = clue['text']
+            typ = clue['type']
+
+            parser = PARSERS.get(typ)
+            if parser is None:
+                continue
+            try:
+                constraint = parser(text, self)
+            except Exception as e:
+                print(f"Warning: Could not parse clue '{text}' of type '{typ}': {e}")
+                continue
+            if constraint is not None:
+                parsed.append(constraint)
+
+        return parsed
+
+    def _filter_candidates(self, parsed):
+        """Return the (actor, vector, asset) triplets allowed by every parsed clue."""
+        shape = (len(self.actors), len(self.vectors), len(self.assets))
+        if shape[0] * shape[1] * shape[2] < NUMPY_MIN_CELLS:
+            cells = self._filter_cells(parsed, shape)
+        else:
+            cells = self._filter_grid(parsed, shape)
+        return [self._names(a, v, t) for a, v, t in cells]
+
+    @staticmethod
+    def _filter_cells(parsed, shape):
+        """Apply the parsed clues as set filters over the index triplets."""
+        actors, vectors, assets = (range(n) for n in shape)
+        candidates = set(itertools.product(actors, vectors, assets))
+
+        for typ, actor, vector, asset in parsed:
+            if typ == 'negation':
+                candidates -= {(actor, vector, t) for t in assets}
+            elif typ == 'affirmative':
+                candidates &= {(a, vector, asset) for a in actors}
+            elif typ == 'relational':
+                candidates -= {(a, vector, asset) for a in actors}
+            elif typ == 'conditional':
+                candidates -= {(actor, vector, t) for t in assets if t != asset}
+
+        return sorted(candidates)
+
+    @staticmethod
+    def _filter_grid(parsed, shape):
+        """Apply the parsed clues as masks over a NumPy actor x vector x asset grid."""
+        import numpy as np
+
+        candidates = np.ones(shape, dtype=np.uint8)
+
+        # Pack the clues into parallel integer arrays for the kernel;
+        # unused indices are stored as -1
+        kinds = np.array([CLUE_CODES[typ] for typ, _, _, _ in parsed], dtype=np.int64)
+        indices = np.array([[-1 if i is None else i for i in clue[1:]] for clue in parsed],
+                           dtype=np.int64).reshape(-1, 3)
+        _clue_kernel()(candidates, kinds, indices[:, 0].copy(), indices[:, 1].copy(),
+                       indices[:, 2].copy())
+
+        return np.argwhere(candidates).tolist()
+
+    def _add_clues(self, parsed):
+        """Encode the parsed clues as solver constraints."""
+        from z3 import And, Not, Implies
+
+        s = self.solver
+        actor_is, vector_is, asset_is = self.actor_is, self.vector_is, self.asset_is
+
+        for typ, actor, vector, asset in parsed:
             if typ == 'negation':
-                # Example pattern: "GhostShell did not use SQL Injection."
-                # Find actor and vector by matching against known lists
-                actor = None
-                vector = None
-                
-                for a in actors:
-                    if a in text:
-                        actor = a
-                        break
-                
-                for v in vectors:
-                    if v in text:
-                        vector = v
-                        break
-                
-                if actor and vector:
-                    # For any asset, forbid (actor, vector, *)
-                    for t in assets:
-                        if (actor, vector, t) in trip_vars:
-                            s.add(Not(trip_vars[(actor, vector, t)]))
-                
+                s.add(Not(And(actor_is[actor], vector_is[vector])))
             elif typ == 'affirmative':
-                # e.g. "Phishing was used against the Email Server."
-                vector = None
-                asset = None
-                
-                for v in vectors:
-                    if v in text:
-                        vector = v
-                        break
-                
-                for t in assets:
-                    if t in text:
-                        asset = t
-                        break
-                
-                if vector and asset:
-                    # require existence of some actor: any triplet with (vector, asset)
-                    valid_triplets = [
-                        trip_vars[(a, vector, asset)]
-                        for a in actors
-                        if (a, vector, asset) in trip_vars
-                    ]
-                    if valid_triplets:
-                        s.add(Or(*valid_triplets))
-                
+                s.add(And(vector_is[vector], asset_is[asset]))
             elif typ == 'relational':
-                # e.g. "The actor that used SQL Injection did not access the HR Portal."
-                vector = None
-                asset = None
-                
-                for v in vectors:
-                    if v in text:
-                        vector = v
-                        break
-                
-                for t in assets:
-                    if t in text:
-                        asset = t
-                        break
-                
-                if vector and asset:
-                    # For any actor, forbid (actor, vector, asset)
-                    for a in actors:
-                        if (a, vector, asset) in trip_vars:
-                            s.add(Not(trip_vars[(a, vector, asset)]))
-                
+                s.add(Implies(vector_is[vector], Not(asset_is[asset])))
             elif typ == 'conditional':
-                # e.g. "If ZeroShadow used RDP Exploit, then they accessed the Finance Database."
-                actor = None
-                vector = None
-                asset = None
-                
-                for a in actors:
-                    if a in text:
-                        actor = a
-                        break
-                
-                for v in vectors:
-                    if v in text:
-                        vector = v
-                        break
-                
-                for t in assets:
-                    if t in text:
-                        asset = t
-                        break
-                
-                if actor and vector and asset:
-                    # If this actor used this vector, then they must have accessed this specific asset
-                    # This means: if (actor, vector, asset) is true, then no other asset can be true for this actor-vector pair
-                    # And: if any (actor, vector, other_asset) is true, then (actor, vector, asset) must be true
-                    
-                    # For any other asset, if (actor, vector, other_asset) is true, then (actor, vector, asset) must be true
-                    for t in assets:
-                        if t != asset and (actor, vector, t) in trip_vars:
-                            # If (actor, vector, t) is true, then (actor, vector, asset) must be true
-                            s.add(Implies(trip_vars[(actor, vector, t)], trip_vars[(actor, vector, asset)]))
-                    
-                    # Also ensure that if (actor, vector, asset) is true, then no other asset can be true for this actor-vector pair
-                    for t in assets:
-                        if t != asset and (actor, vector, t) in trip_vars:
-                            s.add(Implies(trip_vars[(actor, vector, asset)], Not(trip_vars[(actor, vector, t)])))
-                
-            elif typ == 'data-inference':
-                # e.g. "Only attacks using SQL Injection resulted in theft of Source Code."
-                vector = None
-                data_type = None
-                
-                for v in vectors:
-                    if v in text:
-                        vector = v
-                        break
-                
-                for d in stolen_data_opts:
-                    if d in text:
-                        data_type = d
-                        break
-                
-                # This clue type is mainly for data inference validation
-                # The actual logic constraints are handled by other clue types
-                pass
-                
-        except Exception as e:
-            print(f"Warning: Could not parse clue '{text}' of type '{typ}': {e}")
-            continue
-
-    # Solve and check
-    if s.check() != sat:
+                # If this actor used this vector, then they must have accessed this specific asset
+                s.add(Implies(And(actor_is[actor], vector_is[vector]), asset_is[asset]))
+
+    def _selected(self, model, group):
+        return [i for i, var in enumerate(group) if model.evaluate(var)]
+
+    def _solve(self):
+        """Return up to two satisfying triplets, or None if unsatisfiable."""
+        from z3 import And, Not, sat
+
+        s = self.solver
+        if s.check() != sat:
+            return None
+
+        true_triples = []
+        model = s.model()
+        found = (self._selected(model, self.actor_is)
+                 + self._selected(model, self.vector_is)
+                 + self._selected(model, self.asset_is))
+        if len(found) == 3:
+            true_triples.append(self._names(*found))
+
+            # Each model selects exactly one triplet, so look for a second model
+            # that selects a different triplet to detect ambiguity
+            a, v, t = found
+            s.add(Not(And(self.actor_is[a], self.vector_is[v], self.asset_is[t])))
+            if s.check() == sat:
+                model = s.model()
+                true_triples.append(self._names(self._selected(model, self.actor_is)[0],
+                                                self._selected(model, self.vector_is)[0],
+                                                self._selected(model, self.asset_is)[0]))
+        return true_triples
+
+    def _names(self, a, v, t):
+        return (self.actors[a], self.vectors[v], self.assets[t])
+
+
+@functools.lru_cache(maxsize=32)
+def _get_validator(actors: tuple, vectors: tuple, assets: tuple) -> PuzzleValidator:
+    return PuzzleValidator(actors, vectors, assets)
+
+
+def validate_puzzle(puzzle: dict):
+    key = _puzzle_key(puzzle)
+    if key not in _validation_cache:
+        validator = _get_validator(tuple(puzzle['actors']),
+                                   tuple(puzzle['vectors']),
+                                   tuple(puzzle['assets']))
+        _validation_cache[key] = validator.validate(puzzle)
+    # Hand out a copy so callers can't modify the cached result
+    return copy.deepcopy(_validation_cache[key])
+
+
+def _build_result(puzzle: dict, true_triples):
+    """Turn the solver outcome into a status dict for the puzzle."""
+    actors = puzzle['actors']
+    vectors = puzzle['vectors']
+    assets = puzzle['assets']
+    solution = puzzle['solution']
+
+    if true_triples is None:
         return {
             "status": "invalid", 
             "reason": "unsatisfiable (no solutions)",
@@ -179,9 +353,6 @@ def validate_puzzle(puzzle: dict):
             ]
         }
 
-    model = s.model()
-    true_triples = [trip for trip, var in trip_vars.items() if model.evaluate(var)]
-
     if len(true_triples) > 1:
         # Multiple solutions found
         solution_descriptions = []
@@ -241,7 +412,8 @@ def validate_puzzle(puzzle: dict):
 
     # Check stolen_data inference path: crude check—exists final clue linking
     ds = solution['stolen_data']
-    related = any(ds in clue['text'] for clue in puzzle['clues'])
+    all_text = "\n".join(clue['text'] for clue in puzzle['clues'])
+    related = ds in all_text
     if not related:
         return {
             "status": "data-not-inferable",
@@ -258,7 +430,7 @@ def validate_puzzle(puzzle: dict):
         "solution": {"actor": sol[0], "vector": sol[1], "asset": sol[2], "stolen_data": ds},
         "explanation": "The puzzle is logically consistent and has exactly one solution that matches your declared solution.",
         "validation_summary": {
-            "total_possibilities": len(trip_vars),
+            "total_possibilities": len(actors) * len(vectors) * len(assets),
             "clues_processed": len(puzzle['clues']),
             "solution_unique": True,
             "data_inferable": True
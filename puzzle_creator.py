@@ -5,23 +5,57 @@ A tool for creating cybersecurity logic puzzles with automated validation.
 """
 
 import json
+import os
 import random
-from dataclasses import dataclass, asdict
+from collections import Counter
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
+from itertools import product
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator, NamedTuple, Optional, Tuple
 from datetime import datetime
 
 from logic_validator import validate_puzzle
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional: fall back to the stdlib encoder
+    orjson = None
 
-class Difficulty(Enum):
+
+def dump_json_bytes(data: Any) -> bytes:
+    """Serialize data as 2-space indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def load_json_bytes(raw: bytes) -> Any:
+    """Parse JSON from bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def write_json_atomic(filepath: Path, data: Any) -> None:
+    """Write data as JSON in one write to a temp file, then move it into place."""
+    tmp_path = filepath.with_suffix(".json.tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(dump_json_bytes(data))
+    os.replace(tmp_path, filepath)
+
+
+# str mixins make each member equal to (and serialize as) its value, so
+# puzzle dicts can hold members directly without .value lookups
+class Difficulty(str, Enum):
     EASY = "easy"
     MEDIUM = "medium"
     IMPOSSIBLE = "impossible"
 
 
-class ClueType(Enum):
+class ClueType(str, Enum):
     NEGATION = "negation"
     AFFIRMATIVE = "affirmative"
     RELATIONAL = "relational"
@@ -29,22 +63,51 @@ class ClueType(Enum):
     DATA_INFERENCE = "data_inference"
 
 
-@dataclass
+# Direct value -> member lookups for loading saved puzzles
+_DIFFICULTY_BY_VALUE = {difficulty.value: difficulty for difficulty in Difficulty}
+_CLUE_TYPE_BY_VALUE = {clue_type.value: clue_type for clue_type in ClueType}
+# logic_validator spells this type with a hyphen; accept its fixtures too
+_CLUE_TYPE_BY_VALUE['data-inference'] = ClueType.DATA_INFERENCE
+
+# Clue text for each type, filled in by AutomaticPuzzleGenerator
+CLUE_TEMPLATES = {
+    ClueType.NEGATION: "{actor} did not use {vector}.",
+    ClueType.AFFIRMATIVE: "{vector} was used against the {asset}.",
+    ClueType.RELATIONAL: "The actor that used {vector} did not access the {asset}.",
+    ClueType.CONDITIONAL: "If {actor} used {vector}, then they accessed the {asset}.",
+    ClueType.DATA_INFERENCE: "Only attacks using {vector} resulted in theft of {data}.",
+}
+
+
+# Explicit __slots__ rather than dataclass(slots=True), which needs Python 3.10.
+# Frozen: a solution never changes once chosen
+@dataclass(frozen=True)
 class PuzzleSolution:
+    __slots__ = ('actor', 'vector', 'asset', 'stolen_data')
     actor: str
     vector: str
     asset: str
     stolen_data: str
 
+    # Frozen slotted classes can't be restored through setattr, which pickle
+    # and copy use by default, so set the slots directly
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
 
-@dataclass
-class Clue:
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+class Clue(NamedTuple):
     text: str
     type: ClueType
 
 
 @dataclass
 class Puzzle:
+    __slots__ = ('author', 'difficulty', 'actors', 'vectors', 'assets',
+                 'stolen_data', 'solution', 'clues')
     author: str
     difficulty: Difficulty
     actors: List[str]
@@ -53,6 +116,27 @@ class Puzzle:
     stolen_data: List[str]
     solution: PuzzleSolution
     clues: List[Clue]
+    
+    @property
+    def as_dict(self) -> Dict[str, Any]:
+        """JSON-ready dict for this puzzle, built fresh on every access."""
+        # Built by hand: dataclasses.asdict recurses and deep-copies
+        solution = self.solution
+        return {
+            'author': self.author,
+            'difficulty': self.difficulty,
+            'actors': list(self.actors),
+            'vectors': list(self.vectors),
+            'assets': list(self.assets),
+            'stolen_data': list(self.stolen_data),
+            'solution': {
+                'actor': solution.actor,
+                'vector': solution.vector,
+                'asset': solution.asset,
+                'stolen_data': solution.stolen_data,
+            },
+            'clues': [{'text': clue.text, 'type': clue.type} for clue in self.clues],
+        }
 
 
 class PuzzleConfig:
@@ -61,6 +145,9 @@ class PuzzleConfig:
     MAX_ITEMS = 6
     PUZZLES_DIR = "puzzles"
     PUZZLE_FILE_PATTERN = "web_*_draft.json"
+    PUZZLE_FILE_PREFIX = "web_"
+    PUZZLE_FILE_SUFFIX = "_draft.json"
+    NEXT_ID_FILE = ".next_id"
     DATA_DIR = "data"
     THREAT_ACTORS_FILE = "data_threat_actors.json"
     ATTACK_VECTORS_FILE = "data_attack_vectors.json"
@@ -68,57 +155,118 @@ class PuzzleConfig:
     DATATYPES_FILE = "data_datatypes.json"
     AUTO_ITEMS_PER_CATEGORY = 3
     AUTO_CLUES_COUNT = 10  # 2 of each type
+    DIFFICULTY_CHOICES = {1: Difficulty.EASY, 2: Difficulty.MEDIUM, 3: Difficulty.IMPOSSIBLE}
+    DIFFICULTY_MENU = "Select Difficulty:\n" + "\n".join(
+        f"{number}) {level.value}" for number, level in DIFFICULTY_CHOICES.items())
 
 
 class PuzzleManager:
     """Manages file operations for puzzles."""
     
-    @staticmethod
-    def get_next_puzzle_number() -> int:
+    # Highest puzzle number in use; loaded from the counter file (or a scan)
+    # once, then kept up to date by save_puzzle
+    _cached_max: Optional[int] = None
+    # Set once the puzzles directory is known to exist
+    _dir_ready = False
+    
+    @classmethod
+    def _ensure_puzzles_dir(cls) -> Path:
+        """Create the puzzles directory on first use and return its path."""
+        puzzles_dir = Path(PuzzleConfig.PUZZLES_DIR)
+        if not cls._dir_ready:
+            puzzles_dir.mkdir(exist_ok=True)
+            cls._dir_ready = True
+        return puzzles_dir
+    
+    @classmethod
+    def get_next_puzzle_number(cls) -> int:
         """Get the next available puzzle number."""
+        if cls._cached_max is None:
+            next_id = cls._read_next_id()
+            if next_id is None:
+                cls._cached_max = cls._scan_max_puzzle_number()
+            else:
+                cls._cached_max = next_id - 1
+        return cls._cached_max + 1
+    
+    @staticmethod
+    def _read_next_id() -> Optional[int]:
+        """Read the saved next puzzle number, or None if it is missing or stale."""
+        puzzles_dir = Path(PuzzleConfig.PUZZLES_DIR)
+        try:
+            text = (puzzles_dir / PuzzleConfig.NEXT_ID_FILE).read_text().strip()
+        except OSError:
+            return None
+        if not text.isdecimal():
+            return None
+        next_id = int(text)
+        # A draft already at that number means the file is out of date
+        if (puzzles_dir / f"web_{next_id}_draft.json").exists():
+            return None
+        return next_id
+    
+    @staticmethod
+    def _write_next_id(puzzles_dir: Path, next_id: int) -> None:
+        """Atomically record the next puzzle number."""
+        counter_path = puzzles_dir / PuzzleConfig.NEXT_ID_FILE
+        tmp_path = counter_path.with_name(counter_path.name + ".tmp")
+        tmp_path.write_text(str(next_id))
+        os.replace(tmp_path, counter_path)
+    
+    @staticmethod
+    def _scan_max_puzzle_number() -> int:
+        """Find the highest puzzle number in the puzzles directory."""
         puzzles_dir = Path(PuzzleConfig.PUZZLES_DIR)
         if not puzzles_dir.exists():
-            return 1
-        
-        existing_files = list(puzzles_dir.glob(PuzzleConfig.PUZZLE_FILE_PATTERN))
-        if not existing_files:
-            return 1
-        
-        numbers = []
-        for file in existing_files:
-            try:
-                # Extract number from filename like "web_1.json"
-                number = int(file.stem.split('_')[1])
-                numbers.append(number)
-            except (ValueError, IndexError):
-                continue
+            return 0
+        
+        max_number = 0
+        with os.scandir(puzzles_dir) as entries:
+            for entry in entries:
+                number = PuzzleManager._parse_puzzle_number(entry.name)
+                if number is not None and entry.is_file(follow_symlinks=False):
+                    max_number = max(max_number, number)
         
-        return max(numbers) + 1 if numbers else 1
+        return max_number
     
     @staticmethod
-    def save_puzzle(puzzle: Puzzle, puzzle_number: int) -> str:
+    def _parse_puzzle_number(name: str) -> Optional[int]:
+        """Extract the number from a filename like "web_1_draft.json"."""
+        prefix, suffix = PuzzleConfig.PUZZLE_FILE_PREFIX, PuzzleConfig.PUZZLE_FILE_SUFFIX
+        if not (name.startswith(prefix) and name.endswith(suffix)):
+            return None
+        digits = name[len(prefix):-len(suffix)]
+        return int(digits) if digits.isdecimal() else None
+    
+    @staticmethod
+    def puzzle_to_dict(puzzle: Puzzle) -> Dict[str, Any]:
+        """Convert a puzzle to a JSON-ready dict."""
+        return puzzle.as_dict
+    
+    @staticmethod
+    def save_puzzle(puzzle: Puzzle, puzzle_number: int,
+                    puzzle_dict: Optional[Dict[str, Any]] = None) -> str:
         """Save puzzle to JSON file."""
-        puzzles_dir = Path(PuzzleConfig.PUZZLES_DIR)
-        puzzles_dir.mkdir(exist_ok=True)
+        puzzles_dir = PuzzleManager._ensure_puzzles_dir()
         
         filename = f"web_{puzzle_number}_draft.json"
         filepath = puzzles_dir / filename
         
-        # Convert puzzle to dict, handling enums
-        puzzle_dict = asdict(puzzle)
-        puzzle_dict['difficulty'] = puzzle.difficulty.value
-        puzzle_dict['clues'] = [{'text': clue.text, 'type': clue.type.value} for clue in puzzle.clues]
+        if puzzle_dict is None:
+            puzzle_dict = PuzzleManager.puzzle_to_dict(puzzle)
+        
+        write_json_atomic(filepath, puzzle_dict)
         
-        with open(filepath, 'w') as f:
-            json.dump(puzzle_dict, f, indent=2)
+        next_id = max(PuzzleManager.get_next_puzzle_number(), puzzle_number + 1)
+        PuzzleManager._cached_max = next_id - 1
+        PuzzleManager._write_next_id(puzzles_dir, next_id)
         
         return str(filepath)
     
     @staticmethod
     def save_validation_results(puzzle_number: int, validation_result: Dict[str, Any]) -> str:
         """Save validation results to JSON file."""
-        puzzles_dir = Path(PuzzleConfig.PUZZLES_DIR)
-        puzzles_dir.mkdir(exist_ok=True)
+        puzzles_dir = PuzzleManager._ensure_puzzles_dir()
         
         filename = f"web_{puzzle_number}_review.json"
         filepath = puzzles_dir / filename
@@ -135,12 +283,15 @@ class PuzzleManager:
             }
         }
         
-        with open(filepath, 'w') as f:
-            json.dump(validation_output, f, indent=2)
+        write_json_atomic(filepath, validation_output)
         
         return str(filepath)
 
 
+# Parsed data files shared by every DataManager, keyed by (path, mtime_ns)
+_data_file_cache: Dict[Tuple[str, int], List[str]] = {}
+
+
 class DataManager:
     """Manages loading and caching of data from JSON files."""
     
@@ -154,25 +305,29 @@ class DataManager:
         """Load data from JSON file with duplicate removal."""
         filepath = Path(PuzzleConfig.DATA_DIR) / filename
         
-        if not filepath.exists():
-            raise FileNotFoundError(f"Data file not found: {filepath}")
+        try:
+            mtime_ns = filepath.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Data file not found: {filepath}") from None
+        
+        cache_key = (str(filepath), mtime_ns)
+        cached = _data_file_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        data = load_json_bytes(filepath.read_bytes())
         
         if not isinstance(data, list):
             raise ValueError(f"Invalid data format in {filename}: expected list")
         
         # Remove duplicates while preserving order
-        unique_data = []
-        for item in data:
-            if item not in unique_data:
-                unique_data.append(item)
+        unique_data = list(dict.fromkeys(data))
         
         # Warn if duplicates were found
         if len(unique_data) < len(data):
             print(f"⚠️  Warning: Removed {len(data) - len(unique_data)} duplicate entries from {filename}")
         
+        _data_file_cache[cache_key] = unique_data
         return unique_data
     
     def get_actors(self) -> List[str]:
@@ -199,59 +354,74 @@ class DataManager:
             self._datatypes_cache = self._load_json_file(PuzzleConfig.DATATYPES_FILE)
         return self._datatypes_cache
     
-    def select_random_subset(self, data: List[str], count: int) -> List[str]:
+    def select_random_subset(self, data: List[str], count: int, rng=random) -> List[str]:
         """Select a random subset of data."""
         if count > len(data):
             raise ValueError(f"Requested {count} items but only {len(data)} available")
         
-        return random.sample(data, count)
+        return rng.sample(data, count)
 
 
 class AutomaticPuzzleGenerator:
     """Generates puzzles automatically without user interaction."""
     
-    def __init__(self, data_manager: DataManager):
+    def __init__(self, data_manager: DataManager, rng: Optional[random.Random] = None,
+                 verbose: bool = True):
         self.data_manager = data_manager
+        # Progress output; batch callers can turn it off
+        self.verbose = verbose
+        # All draws for a puzzle go through one generator; pass a seeded
+        # random.Random for reproducible puzzles. Defaults to the module RNG.
+        self.rng = rng if rng is not None else random
+    
+    def _log(self, message: str) -> None:
+        """Print a progress message when verbose."""
+        if self.verbose:
+            print(message)
     
     def generate_puzzle(self, author: str, difficulty: Difficulty) -> Puzzle:
         """Generate a complete puzzle automatically."""
-        print("🤖 Generating automatic puzzle...")
+        self._log("🤖 Generating automatic puzzle...")
         
         # Select random elements
         actors = self.data_manager.select_random_subset(
             self.data_manager.get_actors(), 
-            PuzzleConfig.AUTO_ITEMS_PER_CATEGORY
+            PuzzleConfig.AUTO_ITEMS_PER_CATEGORY,
+            self.rng
         )
         vectors = self.data_manager.select_random_subset(
             self.data_manager.get_vectors(), 
-            PuzzleConfig.AUTO_ITEMS_PER_CATEGORY
+            PuzzleConfig.AUTO_ITEMS_PER_CATEGORY,
+            self.rng
         )
         assets = self.data_manager.select_random_subset(
             self.data_manager.get_assets(), 
-            PuzzleConfig.AUTO_ITEMS_PER_CATEGORY
+            PuzzleConfig.AUTO_ITEMS_PER_CATEGORY,
+            self.rng
         )
         datatypes = self.data_manager.select_random_subset(
             self.data_manager.get_datatypes(), 
-            1
+            1,
+            self.rng
         )
         
-        print(f"✅ Selected {len(actors)} actors: {', '.join(actors)}")
-        print(f"✅ Selected {len(vectors)} vectors: {', '.join(vectors)}")
-        print(f"✅ Selected {len(assets)} assets: {', '.join(assets)}")
-        print(f"✅ Selected data type: {datatypes[0]}")
+        self._log(f"✅ Selected {len(actors)} actors: {', '.join(actors)}\n"
+                  f"✅ Selected {len(vectors)} vectors: {', '.join(vectors)}\n"
+                  f"✅ Selected {len(assets)} assets: {', '.join(assets)}\n"
+                  f"✅ Selected data type: {datatypes[0]}")
         
         # Validate uniqueness
         self._validate_uniqueness(actors, vectors, assets, datatypes)
         
         # Create solution
         solution = PuzzleSolution(
-            actor=random.choice(actors),
-            vector=random.choice(vectors),
-            asset=random.choice(assets),
+            actor=self.rng.choice(actors),
+            vector=self.rng.choice(vectors),
+            asset=self.rng.choice(assets),
             stolen_data=datatypes[0]
         )
         
-        print(f"🎯 Solution: {solution.actor} used {solution.vector} against {solution.asset}")
+        self._log(f"🎯 Solution: {solution.actor} used {solution.vector} against {solution.asset}")
         
         # Generate clues
         clues = self._generate_random_clues(actors, vectors, assets, solution)
@@ -271,88 +441,62 @@ class AutomaticPuzzleGenerator:
                            assets: List[str], datatypes: List[str]) -> None:
         """Validate that all puzzle elements contain only unique items."""
         # Check each category for duplicates
-        if len(actors) != len(set(actors)):
-            duplicates = [actor for actor in actors if actors.count(actor) > 1]
-            raise ValueError(f"Duplicate actors found: {duplicates}")
-        
-        if len(vectors) != len(set(vectors)):
-            duplicates = [vector for vector in vectors if vectors.count(vector) > 1]
-            raise ValueError(f"Duplicate vectors found: {duplicates}")
+        for label, items in (("actors", actors), ("vectors", vectors),
+                             ("assets", assets), ("data types", datatypes)):
+            if len(items) != len(set(items)):
+                duplicates = [item for item, count in Counter(items).items() if count > 1]
+                raise ValueError(f"Duplicate {label} found: {duplicates}")
         
-        if len(assets) != len(set(assets)):
-            duplicates = [asset for asset in assets if assets.count(asset) > 1]
-            raise ValueError(f"Duplicate assets found: {duplicates}")
-        
-        if len(datatypes) != len(set(datatypes)):
-            duplicates = [data_type for data_type in datatypes if datatypes.count(data_type) > 1]
-            raise ValueError(f"Duplicate data types found: {duplicates}")
-        
-        print("✅ All puzzle elements are unique")
+        self._log("✅ All puzzle elements are unique")
     
     def _generate_random_clues(self, actors: List[str], vectors: List[str], 
                              assets: List[str], solution: PuzzleSolution) -> List[Clue]:
         """Generate two clues of each type for the puzzle."""
         clues = []
-        used_clues = set()
-        clue_types = list(ClueType)
-        random.shuffle(clue_types)  # Shuffle to vary clue order
-
-        # Helper to avoid duplicate clues
-        def add_clue(text, clue_type):
-            key = (clue_type, text)
-            if key not in used_clues:
+        used_texts = set()
+
+        # Helper to avoid duplicate clues; each type's template has its own
+        # wording, so the text alone identifies a clue
+        def add_clue(clue_type, **fields):
+            text = CLUE_TEMPLATES[clue_type].format(**fields)
+            if text not in used_texts:
                 clues.append(Clue(text=text, type=clue_type))
-                used_clues.add(key)
-                print(f"🔍 Generated clue {len(clues)}: {text}")
+                used_texts.add(text)
+
+        # Candidate pools; each excludes the pairing that is the real solution
+        actor_vector_pool = [(a, v) for a, v in product(actors, vectors)
+                             if not (a == solution.actor and v == solution.vector)]
+        vector_asset_pool = [(v, asset) for v, asset in product(vectors, assets)
+                             if not (v == solution.vector and asset == solution.asset)]
+        triple_pool = [(a, v, asset) for a, v, asset in product(actors, vectors, assets)
+                       if not (a == solution.actor and v == solution.vector and asset == solution.asset)]
+
+        def pick_two(pool):
+            return self.rng.sample(pool, min(2, len(pool)))
 
         # Negation clues (2)
-        negation_options = []
-        for a in actors:
-            for v in vectors:
-                if not (a == solution.actor and v == solution.vector):
-                    negation_options.append((a, v))
-        random.shuffle(negation_options)
-        for a, v in negation_options[:2]:
-            add_clue(f"{a} did not use {v}.", ClueType.NEGATION)
+        for a, v in pick_two(actor_vector_pool):
+            add_clue(ClueType.NEGATION, actor=a, vector=v)
 
         # Affirmative clues (2)
-        affirmative_options = []
-        for v in vectors:
-            for asset in assets:
-                if not (v == solution.vector and asset == solution.asset):
-                    affirmative_options.append((v, asset))
-        random.shuffle(affirmative_options)
-        for v, asset in affirmative_options[:2]:
-            add_clue(f"{v} was used against the {asset}.", ClueType.AFFIRMATIVE)
+        for v, asset in pick_two(vector_asset_pool):
+            add_clue(ClueType.AFFIRMATIVE, vector=v, asset=asset)
 
         # Relational clues (2)
-        relational_options = []
-        for v in vectors:
-            for asset in assets:
-                if not (v == solution.vector and asset == solution.asset):
-                    relational_options.append((v, asset))
-        random.shuffle(relational_options)
-        for v, asset in relational_options[:2]:
-            add_clue(f"The actor that used {v} did not access the {asset}.", ClueType.RELATIONAL)
+        for v, asset in pick_two(vector_asset_pool):
+            add_clue(ClueType.RELATIONAL, vector=v, asset=asset)
 
         # Conditional clues (2)
-        conditional_options = []
-        for a in actors:
-            for v in vectors:
-                for asset in assets:
-                    if not (a == solution.actor and v == solution.vector and asset == solution.asset):
-                        conditional_options.append((a, v, asset))
-        random.shuffle(conditional_options)
-        for a, v, asset in conditional_options[:2]:
-            add_clue(f"If {a} used {v}, then they accessed the {asset}.", ClueType.CONDITIONAL)
+        for a, v, asset in pick_two(triple_pool):
+            add_clue(ClueType.CONDITIONAL, actor=a, vector=v, asset=asset)
 
         # Data Inference clues (2)
-        data_inference_options = []
-        for v in vectors:
-            data_inference_options.append((v, solution.stolen_data))
-        random.shuffle(data_inference_options)
-        for v, d in data_inference_options[:2]:
-            add_clue(f"Only attacks using {v} resulted in theft of {d}.", ClueType.DATA_INFERENCE)
+        for v in pick_two(vectors):
+            add_clue(ClueType.DATA_INFERENCE, vector=v, data=solution.stolen_data)
+
+        if self.verbose:
+            print("\n".join(f"🔍 Generated clue {number}: {clue.text}"
+                            for number, clue in enumerate(clues, 1)))
 
         return clues
 
@@ -363,6 +507,34 @@ class PuzzleCreator:
     def __init__(self):
         self.data_manager = DataManager()
         self.puzzle_generator = AutomaticPuzzleGenerator(self.data_manager)
+        self._next_number: Optional[int] = None
+    
+    @staticmethod
+    def create_from_spec(spec: Dict[str, Any]) -> Puzzle:
+        """Build a puzzle from a dict in the saved JSON format, without prompting."""
+        return Puzzle(
+            author=spec.get('author') or "Anonymous",
+            difficulty=_DIFFICULTY_BY_VALUE[spec['difficulty']],
+            actors=list(spec['actors']),
+            vectors=list(spec['vectors']),
+            assets=list(spec['assets']),
+            stolen_data=list(spec['stolen_data']),
+            solution=PuzzleSolution(**spec['solution']),
+            clues=[Clue(text=clue['text'], type=_CLUE_TYPE_BY_VALUE[clue['type']])
+                   for clue in spec['clues']]
+        )
+    
+    @staticmethod
+    def batch_validate(specs: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Validate many puzzle dicts in parallel across CPU cores."""
+        with ProcessPoolExecutor() as executor:
+            return list(executor.map(validate_puzzle, specs, chunksize=4))
+    
+    def generate_batch(self, count: int, author: str = "Anonymous",
+                       difficulty: Difficulty = Difficulty.EASY) -> Iterator[Puzzle]:
+        """Yield count generated puzzles, sharing this creator's loaded data."""
+        for _ in range(count):
+            yield self.puzzle_generator.generate_puzzle(author, difficulty)
     
     def create_puzzle(self) -> Puzzle:
         """Create a puzzle automatically."""
@@ -375,43 +547,43 @@ class PuzzleCreator:
             author = "Anonymous"
         
         # Select difficulty
-        print("Select Difficulty:")
-        print("1) easy")
-        print("2) medium")
-        print("3) impossible")
+        choices = PuzzleConfig.DIFFICULTY_CHOICES
+        print(PuzzleConfig.DIFFICULTY_MENU)
         
         while True:
-            try:
-                difficulty_choice = int(input("Difficulty (1-3): "))
-                if difficulty_choice in [1, 2, 3]:
-                    break
-                print("❌ Please enter 1, 2, or 3.")
-            except ValueError:
+            user_input = input("Difficulty (1-3): ").strip()
+            # isdecimal() guarantees int() succeeds, so no exception handling
+            if not user_input.isdecimal():
                 print("❌ Please enter a valid number.")
+                continue
+            difficulty_choice = int(user_input)
+            if difficulty_choice in choices:
+                break
+            print("❌ Please enter 1, 2, or 3.")
         
-        difficulty_map = {1: Difficulty.EASY, 2: Difficulty.MEDIUM, 3: Difficulty.IMPOSSIBLE}
-        difficulty = difficulty_map[difficulty_choice]
+        difficulty = choices[difficulty_choice]
+        
+        # Reserve the puzzle number now so saving doesn't rescan the directory
+        self._next_number = PuzzleManager.get_next_puzzle_number()
         
         # Generate puzzle automatically
         return self.puzzle_generator.generate_puzzle(author, difficulty)
     
-    def validate_and_save(self, puzzle: Puzzle) -> bool:
+    def validate_and_save(self, puzzle: Puzzle, puzzle_number: Optional[int] = None) -> bool:
         """Validate puzzle and save to file."""
         print("\n🧪 Validating puzzle...")
         
-        # Get next puzzle number
-        puzzle_number = PuzzleManager.get_next_puzzle_number()
+        # Use the number reserved by create_puzzle unless one is given
+        if puzzle_number is None:
+            puzzle_number = self._next_number or PuzzleManager.get_next_puzzle_number()
+        self._next_number = None
         
-        # Save puzzle before validation
-        puzzle_file = PuzzleManager.save_puzzle(puzzle, puzzle_number)
-        print(f"📁 Puzzle saved to {puzzle_file}")
+        # Convert puzzle to dictionary once for both saving and validation
+        puzzle_dict = PuzzleManager.puzzle_to_dict(puzzle)
         
-        # Convert puzzle to dictionary for validation
-        puzzle_dict = asdict(puzzle)
-        puzzle_dict['difficulty'] = puzzle.difficulty.value
-        puzzle_dict['clues'] = [{'text': clue.text, 'type': clue.type.value} for clue in puzzle.clues]
+        puzzle_file = PuzzleManager.save_puzzle(puzzle, puzzle_number, puzzle_dict)
+        print(f"📁 Puzzle saved to {puzzle_file}")
         
-        # Validate puzzle
         validation_result = validate_puzzle(puzzle_dict)
         
         # Save validation results
@@ -1,20 +1,41 @@
 import json
 from logic_validator import validate_puzzle
 
+EASY_PUZZLE = {
+    "actors": ["A", "B", "C"],
+    "vectors": ["X", "Y", "Z"],
+    "assets": ["S1", "S2", "S3"],
+    "stolen_data": ["D1", "D2", "D3"],
+    "solution": {"actor": "A", "vector": "X", "asset": "S2", "stolen_data": "D1"},
+    "clues": [
+        {"text": "A used X on S2.", "type": "affirmative"},
+        {"text": "B did not use Y.", "type": "negation"},
+        {"text": "B did not use X.", "type": "negation"},
+        {"text": "C did not use X.", "type": "negation"},
+        {"text": "The vector X was used against S2.", "type": "affirmative"},
+        {"text": "Only attacks on S2 resulted in D1.", "type": "data-inference"}
+    ]
+}
+
+OVERLAPPING_PUZZLE = {
+    "actors": ["Ghost", "GhostShell"],
+    "vectors": ["Phishing", "Spear Phishing"],
+    "assets": ["Database", "Finance Database"],
+    "stolen_data": ["D1"],
+    "solution": {"actor": "GhostShell", "vector": "Spear Phishing", "asset": "Finance Database", "stolen_data": "D1"},
+    "clues": [
+        {"text": "Spear Phishing was used against the Finance Database.", "type": "affirmative"},
+        {"text": "Ghost did not use Spear Phishing.", "type": "negation"},
+        {"text": "Only attacks using Spear Phishing resulted in theft of D1.", "type": "data-inference"}
+    ]
+}
+
 def test_easy_valid():
-    puzzle = {
-        "actors": ["A", "B", "C"],
-        "vectors": ["X", "Y", "Z"],
-        "assets": ["S1", "S2", "S3"],
-        "stolen_data": ["D1", "D2", "D3"],
-        "solution": {"actor": "A", "vector": "X", "asset": "S2", "stolen_data": "D1"},
-        "clues": [
-            {"text": "A used X on S2.", "type": "affirmative"},
-            {"text": "B did not use Y.", "type": "negation"},
-            {"text": "The vector X was used against S2.", "type": "affirmative"},
-            {"text": "Only attacks on S2 resulted in D1.", "type": "data-inference"}
-        ]
-    }
-    result = validate_puzzle(puzzle)
+    result = validate_puzzle(EASY_PUZZLE)
     assert result['status'] == 'valid'
     assert result['solution']['actor'] == "A"
+
+def test_overlapping_names_match_longest():
+    result = validate_puzzle(OVERLAPPING_PUZZLE)
+    assert result['status'] == 'valid'
+    assert result['solution']['asset'] == "Finance Database"
@@ -2,6 +2,55 @@ import json
 import pytest
 from logic_validator import validate_puzzle
 
+AMBIGUOUS_PUZZLE = {
+    "actors": ["A", "B", "C"],
+    "vectors": ["X", "Y", "Z"],
+    "assets": ["S1", "S2", "S3"],
+    "stolen_data": ["D1", "D2", "D3"],
+    "solution": {"actor": "A", "vector": "X", "asset": "S2", "stolen_data": "D1"},
+    "clues": [
+        {"text": "A did not use Y.", "type": "negation"},
+        {"text": "B did not use Z.", "type": "negation"},
+        {"text": "C did not use X.", "type": "negation"}
+        # No confirmation clue: ambiguous triplets
+    ]
+}
+
+TWO_SOLUTIONS_PUZZLE = {
+    "actors": ["A", "B", "C"],
+    "vectors": ["X", "Y", "Z"],
+    "assets": ["S1", "S2", "S3"],
+    "stolen_data": ["D1"],
+    "solution": {"actor": "A", "vector": "X", "asset": "S2", "stolen_data": "D1"},
+    "clues": [
+        {"text": "X was used against the S2.", "type": "affirmative"},
+        {"text": "C did not use X.", "type": "negation"}
+    ]
+}
+
+ONE_NEGATION_PUZZLE = {
+    "actors": ["A", "B", "C"],
+    "vectors": ["X", "Y", "Z"],
+    "assets": ["S1", "S2", "S3"],
+    "stolen_data": ["D1"],
+    "solution": {"actor": "A", "vector": "X", "asset": "S2", "stolen_data": "D1"},
+    "clues": [
+        {"text": "B did not use Y.", "type": "negation"}
+    ]
+}
+
+CONTRADICTION_PUZZLE = {
+    "actors": ["A", "B", "C"],
+    "vectors": ["X", "Y", "Z"],
+    "assets": ["S1", "S2", "S3"],
+    "stolen_data": ["D1"],
+    "solution": {"actor": "A", "vector": "X", "asset": "S2", "stolen_data": "D1"},
+    "clues": [
+        {"text": "X was used against the S2.", "type": "affirmative"},
+        {"text": "The actor that used X did not access the S2.", "type": "relational"}
+    ]
+}
+
 def test_impossible_unique():
     # Uses the example puzzle in /example
     with open("example/web_impossible.json") as f:
@@ -11,18 +60,23 @@ def test_impossible_unique():
     assert result['solution']['actor'] == "FluxSignal"
 
 def test_ambiguous_fails():
-    puzzle = {
-        "actors": ["A", "B", "C"],
-        "vectors": ["X", "Y", "Z"],
-        "assets": ["S1", "S2", "S3"],
-        "stolen_data": ["D1", "D2", "D3"],
-        "solution": {"actor": "A", "vector": "X", "asset": "S2", "stolen_data": "D1"},
-        "clues": [
-            {"text": "A did not use Y.", "type": "negation"},
-            {"text": "B did not use Z.", "type": "negation"},
-            {"text": "C did not use X.", "type": "negation"}
-            # No confirmation clue: ambiguous triplets
-        ]
-    }
-    result = validate_puzzle(puzzle)
+    result = validate_puzzle(AMBIGUOUS_PUZZLE)
     assert result['status'] == 'ambiguous'
+
+def test_ambiguous_lists_distinct_solutions():
+    # Two actors remain possible for the same vector/asset pair
+    result = validate_puzzle(TWO_SOLUTIONS_PUZZLE)
+    assert result['status'] == 'ambiguous'
+    assert len(set(map(tuple, result['solutions']))) == 2
+
+def test_ambiguous_reports_every_solution():
+    # One negation rules out 3 of the 27 triplets
+    result = validate_puzzle(ONE_NEGATION_PUZZLE)
+    assert result['status'] == 'ambiguous'
+    assert len(result['solutions']) == 24
+    assert "allow 24 different valid solutions" in result['explanation']
+
+def test_contradiction_is_unsatisfiable():
+    result = validate_puzzle(CONTRADICTION_PUZZLE)
+    assert result['status'] == 'invalid'
+    assert result['reason'] == "unsatisfiable (no solutions)"
@@ -0,0 +1,121 @@
+import copy
+import json
+import pickle
+from pathlib import Path
+
+import pytest
+
+from logic_validator import validate_puzzle
+from puzzle_creator import (Clue, ClueType, Difficulty, Puzzle, PuzzleCreator, PuzzleManager,
+                            PuzzleSolution)
+
+DRAFT_FILE = Path(__file__).resolve().parent.parent / "puzzles" / "web_1_draft.json"
+
+
+def make_puzzle():
+    return Puzzle(
+        author="Tester",
+        difficulty=Difficulty.EASY,
+        actors=["A", "B", "C"],
+        vectors=["X", "Y", "Z"],
+        assets=["S1", "S2", "S3"],
+        stolen_data=["D1", "D2", "D3"],
+        solution=PuzzleSolution(actor="A", vector="X", asset="S2", stolen_data="D1"),
+        clues=[Clue("A used X on S2.", ClueType.AFFIRMATIVE),
+               Clue("B did not use Y.", ClueType.NEGATION)],
+    )
+
+
+def test_puzzle_pickle_round_trip():
+    puzzle = make_puzzle()
+    restored = pickle.loads(pickle.dumps(puzzle))
+    assert restored == puzzle
+    assert restored.solution.actor == "A"
+
+
+def test_puzzle_deepcopy():
+    puzzle = make_puzzle()
+    copied = copy.deepcopy(puzzle)
+    assert copied == puzzle
+    assert copied.solution == puzzle.solution
+    assert copy.copy(puzzle.solution) == puzzle.solution
+
+
+def test_as_dict_reflects_mutation():
+    puzzle = make_puzzle()
+    assert len(puzzle.as_dict['clues']) == 2
+    puzzle.clues.append(Clue("C did not use Z.", ClueType.NEGATION))
+    assert puzzle.as_dict['clues'][-1] == {'text': "C did not use Z.", 'type': ClueType.NEGATION}
+
+
+@pytest.fixture
+def puzzles_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    # The next number is cached on the class; start every test cold
+    monkeypatch.setattr(PuzzleManager, "_cached_max", None)
+    monkeypatch.setattr(PuzzleManager, "_dir_ready", False)
+    path = tmp_path / "puzzles"
+    path.mkdir()
+    return path
+
+
+def test_next_id_scans_without_counter(puzzles_dir):
+    (puzzles_dir / "web_3_draft.json").write_text("{}")
+    (puzzles_dir / "web_7_draft.json").write_text("{}")
+    assert PuzzleManager.get_next_puzzle_number() == 8
+
+
+def test_next_id_uses_counter(puzzles_dir):
+    (puzzles_dir / "web_1_draft.json").write_text("{}")
+    (puzzles_dir / ".next_id").write_text("10")
+    assert PuzzleManager.get_next_puzzle_number() == 10
+
+
+def test_next_id_rescans_stale_counter(puzzles_dir):
+    # A draft already exists at the recorded number
+    (puzzles_dir / ".next_id").write_text("2")
+    (puzzles_dir / "web_2_draft.json").write_text("{}")
+    (puzzles_dir / "web_5_draft.json").write_text("{}")
+    assert PuzzleManager.get_next_puzzle_number() == 6
+
+
+def test_next_id_advances_across_saves(puzzles_dir):
+    puzzle = make_puzzle()
+    for expected in (1, 2, 3):
+        number = PuzzleManager.get_next_puzzle_number()
+        assert number == expected
+        PuzzleManager.save_puzzle(puzzle, number)
+    assert (puzzles_dir / ".next_id").read_text() == "4"
+
+    # A new process trusts the counter file
+    PuzzleManager._cached_max = None
+    assert PuzzleManager.get_next_puzzle_number() == 4
+
+
+def load_draft():
+    return json.loads(DRAFT_FILE.read_text(encoding="utf-8"))
+
+
+def test_create_from_spec_round_trips_saved_draft():
+    spec = load_draft()
+    puzzle = PuzzleCreator.create_from_spec(spec)
+    assert puzzle.difficulty is Difficulty.EASY
+    assert ClueType.DATA_INFERENCE in {clue.type for clue in puzzle.clues}
+    assert puzzle.as_dict == spec
+    # Saved files use the enum's underscore spelling
+    assert json.loads(json.dumps(puzzle.as_dict))['clues'][-1]['type'] == "data_inference"
+
+
+def test_create_from_spec_accepts_validator_spelling():
+    spec = load_draft()
+    spec['clues'][-1]['type'] = "data-inference"
+    puzzle = PuzzleCreator.create_from_spec(spec)
+    assert puzzle.clues[-1].type is ClueType.DATA_INFERENCE
+
+
+def test_batch_validate_matches_validate_puzzle():
+    specs = [load_draft(), dict(load_draft(), clues=load_draft()['clues'][:2])]
+    results = PuzzleCreator.batch_validate(specs)
+    assert [result['status'] for result in results] == \
+        [validate_puzzle(spec)['status'] for spec in specs]
+    assert results[1]['status'] == 'ambiguous'
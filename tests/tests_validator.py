@@ -0,0 +1,86 @@
+import random
+
+import pytest
+
+from logic_validator import NUMPY_MIN_CELLS, PuzzleValidator
+from tests_easy import EASY_PUZZLE, OVERLAPPING_PUZZLE
+from tests_impossible import (AMBIGUOUS_PUZZLE, CONTRADICTION_PUZZLE, ONE_NEGATION_PUZZLE,
+                              TWO_SOLUTIONS_PUZZLE)
+
+
+def cross_checked(puzzle):
+    validator = PuzzleValidator(puzzle['actors'], puzzle['vectors'], puzzle['assets'],
+                                cross_check=True)
+    return validator.validate(puzzle)
+
+
+@pytest.mark.parametrize("puzzle, status", [
+    (EASY_PUZZLE, 'valid'),
+    (OVERLAPPING_PUZZLE, 'valid'),
+    (AMBIGUOUS_PUZZLE, 'ambiguous'),
+    (TWO_SOLUTIONS_PUZZLE, 'ambiguous'),
+    (ONE_NEGATION_PUZZLE, 'ambiguous'),
+    (CONTRADICTION_PUZZLE, 'invalid'),
+])
+def test_z3_agrees_with_candidate_filter(puzzle, status):
+    assert cross_checked(puzzle)['status'] == status
+
+
+def test_cross_check_solver_is_reused_across_puzzles():
+    # Each puzzle's clues live in their own push/pop scope
+    validator = PuzzleValidator(["A", "B", "C"], ["X", "Y", "Z"], ["S1", "S2", "S3"],
+                                cross_check=True)
+    assert validator.validate(CONTRADICTION_PUZZLE)['status'] == 'invalid'
+    assert validator.validate(EASY_PUZZLE)['status'] == 'valid'
+    assert validator.validate(ONE_NEGATION_PUZZLE)['status'] == 'ambiguous'
+
+
+def test_cross_check_reports_disagreement(monkeypatch):
+    validator = PuzzleValidator(["A", "B", "C"], ["X", "Y", "Z"], ["S1", "S2", "S3"],
+                                cross_check=True)
+    monkeypatch.setattr(validator, "_filter_candidates", lambda parsed: [])
+    with pytest.raises(RuntimeError):
+        validator.validate(EASY_PUZZLE)
+
+
+def random_parsed_clues(rng, size, count):
+    clues = []
+    for _ in range(count):
+        typ = rng.choice(['negation', 'affirmative', 'relational', 'conditional'])
+        actor, vector, asset = (rng.randrange(size) for _ in range(3))
+        if typ == 'negation':
+            asset = None
+        elif typ in ('affirmative', 'relational'):
+            actor = None
+        clues.append((typ, actor, vector, asset))
+    return clues
+
+
+def test_numpy_grid_matches_set_filter():
+    pytest.importorskip("numpy")
+    rng = random.Random(0)
+    shape = (16, 16, 16)
+    assert shape[0] * shape[1] * shape[2] >= NUMPY_MIN_CELLS
+    for count in [0] * 5 + [rng.randrange(1, 40) for _ in range(200)]:
+        parsed = random_parsed_clues(rng, 16, count)
+        grid = [tuple(cell) for cell in PuzzleValidator._filter_grid(parsed, shape)]
+        assert grid == PuzzleValidator._filter_cells(parsed, shape)
+
+
+def test_large_universe_validates_through_numpy_grid():
+    pytest.importorskip("numpy")
+    names = [str(i).zfill(2) for i in range(16)]
+    actors, vectors, assets = ([f"{prefix}{name}" for name in names]
+                               for prefix in ("Actor", "Vector", "Asset"))
+    validator = PuzzleValidator(actors, vectors, assets)
+    puzzle = {
+        "actors": actors, "vectors": vectors, "assets": assets, "stolen_data": ["D1"],
+        "solution": {"actor": "Actor03", "vector": "Vector05", "asset": "Asset07",
+                     "stolen_data": "D1"},
+        "clues": [{"text": "Vector05 was used against the Asset07 (D1).", "type": "affirmative"}]
+            + [{"text": f"{actor} did not use Vector05.", "type": "negation"}
+               for actor in actors if actor != "Actor03"],
+    }
+    assert validator.validate(puzzle)['status'] == 'valid'
+    assert validator.validate(dict(puzzle, clues=[]))['status'] == 'ambiguous'
+    assert len(validator.validate(dict(puzzle, clues=[]))['solutions']) == 16 ** 3
@@ -0,0 +1,132 @@
+import gzip
+import json
+import os
+
+from website_generator import WebsiteGenerator
+
+PUZZLE = {
+    "author": "Tester",
+    "difficulty": "easy",
+    "actors": ["A", "B", "C"],
+    "vectors": ["X", "Y", "Z"],
+    "assets": ["S1", "S2", "S3"],
+    "stolen_data": ["D1", "D2", "D3"],
+    "solution": {"actor": "A", "vector": "X", "asset": "S2", "stolen_data": "D1"},
+    "clues": [
+        {"text": "A used X on S2.", "type": "affirmative"},
+        {"text": "B did not use Y.", "type": "negation"}
+    ]
+}
+
+
+def write_draft(puzzles_dir, author, mtime):
+    draft = puzzles_dir / "web_1_draft.json"
+    draft.write_text(json.dumps(dict(PUZZLE, author=author)), encoding="utf-8")
+    os.utime(draft, (mtime, mtime))
+
+
+def build(tmp_path, **kwargs):
+    generator = WebsiteGenerator(str(tmp_path / "puzzles"), str(tmp_path / "website"),
+                                 verbose=False, **kwargs)
+    generator.generate_website()
+
+
+def test_plain_build_removes_stale_gzip(tmp_path):
+    puzzles_dir = tmp_path / "puzzles"
+    puzzles_dir.mkdir()
+    write_draft(puzzles_dir, "Before", 1_000_000)
+    build(tmp_path, precompress=True)
+    page_gz = tmp_path / "website" / "puzzle_1.html.gz"
+    assert b"Before" in gzip.decompress(page_gz.read_bytes())
+
+    write_draft(puzzles_dir, "After", 2_000_000_000)
+    build(tmp_path)
+    assert "After" in (tmp_path / "website" / "puzzle_1.html").read_text(encoding="utf-8")
+    assert not page_gz.exists()
+    assert not (tmp_path / "website" / "index.html.gz").exists()
+
+
+def test_incremental_build_skips_up_to_date_pages(tmp_path):
+    puzzles_dir = tmp_path / "puzzles"
+    puzzles_dir.mkdir()
+    write_draft(puzzles_dir, "Tester", 1_000_000)
+    build(tmp_path)
+    page = tmp_path / "website" / "puzzle_1.html"
+    page.write_text("kept", encoding="utf-8")
+    mtime = page.stat().st_mtime_ns
+
+    build(tmp_path)
+    assert page.read_text(encoding="utf-8") == "kept"
+    assert page.stat().st_mtime_ns == mtime
+
+    build(tmp_path, force=True)
+    assert "Tester" in page.read_text(encoding="utf-8")
+
+
+def test_incremental_build_rebuilds_when_draft_is_newer(tmp_path):
+    puzzles_dir = tmp_path / "puzzles"
+    puzzles_dir.mkdir()
+    write_draft(puzzles_dir, "Before", 1_000_000)
+    build(tmp_path)
+    page = tmp_path / "website" / "puzzle_1.html"
+
+    write_draft(puzzles_dir, "After", page.stat().st_mtime + 60)
+    build(tmp_path)
+    assert "After" in page.read_text(encoding="utf-8")
+
+
+def test_incremental_build_rebuilds_when_generator_is_newer(tmp_path):
+    puzzles_dir = tmp_path / "puzzles"
+    puzzles_dir.mkdir()
+    write_draft(puzzles_dir, "Tester", 1_000_000)
+    build(tmp_path)
+    page = tmp_path / "website" / "puzzle_1.html"
+    styles = tmp_path / "website" / "styles.css"
+    for output in (page, styles):
+        output.write_text("old", encoding="utf-8")
+        # Older than website_generator.py but newer than the draft
+        os.utime(output, (2_000_000, 2_000_000))
+
+    build(tmp_path)
+    assert "Tester" in page.read_text(encoding="utf-8")
+    assert styles.read_text(encoding="utf-8") != "old"
+
+
+def test_difficulty_is_escaped(tmp_path):
+    generator = WebsiteGenerator(str(tmp_path / "puzzles"), str(tmp_path / "website"),
+                                 verbose=False)
+    puzzle = dict(PUZZLE, puzzle_number=1, difficulty='easy"><script>x</script>')
+    generator.puzzles = [puzzle]
+    for html in (generator.generate_index_html(), generator.generate_puzzle_page(puzzle)):
+        assert 'difficulty-badge easy"><script>' not in html
+        assert 'difficulty-badge easy&quot;&gt;&lt;script&gt;x&lt;/script&gt;"' in html
+        assert '</script>"' not in html
+
+
+def test_rebuild_does_not_write_through_hardlinks(tmp_path):
+    puzzles_dir = tmp_path / "puzzles"
+    puzzles_dir.mkdir()
+    write_draft(puzzles_dir, "Before", 1_000_000)
+    build(tmp_path)
+    deployed = tmp_path / "deployed.html"
+    os.link(tmp_path / "website" / "puzzle_1.html", deployed)
+
+    write_draft(puzzles_dir, "After", 1_000_000)
+    build(tmp_path, force=True)
+    assert "After" in (tmp_path / "website" / "puzzle_1.html").read_text(encoding="utf-8")
+    assert "Before" in deployed.read_text(encoding="utf-8")
+    assert not list((tmp_path / "website").glob("*.tmp"))
+
+
+def test_gzip_copies_are_reproducible(tmp_path):
+    puzzles_dir = tmp_path / "puzzles"
+    puzzles_dir.mkdir()
+    write_draft(puzzles_dir, "Tester", 1_000_000)
+    build(tmp_path, precompress=True)
+    styles_gz = tmp_path / "website" / "styles.css.gz"
+    first = styles_gz.read_bytes()
+
+    build(tmp_path, precompress=True, force=True)
+    assert styles_gz.read_bytes() == first
+    assert gzip.decompress(first).decode("utf-8") == \
+        (tmp_path / "website" / "styles.css").read_text(encoding="utf-8")
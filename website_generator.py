@@ -6,48 +6,151 @@ This script converts JSON puzzle files into a static website that can be hosted
 on GitHub Pages or any static hosting service. No authentication required.
 """
 
+import argparse
+import gzip
+import io
 import json
 import os
 import sys
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any
-import shutil
+from typing import Dict, List, Any, Optional, Tuple, Union
+from html import escape
+from concurrent.futures import ThreadPoolExecutor
 
 # Set console encoding for Windows
 if sys.platform == "win32":
-    import codecs
-    sys.stdout = codecs.getwriter("utf-8")(sys.stdout.detach())
-    sys.stderr = codecs.getwriter("utf-8")(sys.stderr.detach())
+    # reconfigure() switches the existing streams in place instead of
+    # wrapping them, so callers importing this module keep working streams
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            stream.reconfigure(encoding="utf-8")
+        except AttributeError:
+            pass  # Replaced by something that isn't a TextIOWrapper
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional: fall back to the stdlib json module
+    orjson = None
+
+
+def load_json_bytes(raw: bytes) -> Any:
+    """Parse JSON from bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def parse_puzzle_number(filename: str) -> Optional[int]:
+    """Extract the number from a filename like "web_1_draft.json"."""
+    prefix, suffix = "web_", "_draft.json"
+    if not (filename.startswith(prefix) and filename.endswith(suffix)):
+        return None
+    digits = filename[len(prefix):-len(suffix)]
+    return int(digits) if digits.isdecimal() else None
+
+
+def dump_json_str(data: Any) -> str:
+    """Serialize data as compact JSON text."""
+    if orjson is not None:
+        return orjson.dumps(data).decode('utf-8')
+    return json.dumps(data)
+
+
+def write_file_atomic(path: Path, data: Union[str, bytes]) -> None:
+    """Write text or bytes to a temp file, then move it into place.
+
+    Replacing the file instead of truncating it leaves hardlinks to the old
+    version (deploy.py links deploy/ to website/) untouched.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    if isinstance(data, str):
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(data)
+    else:
+        tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def gzip_bytes(data: bytes) -> bytes:
+    """Compress data at level 9 with a zero timestamp.
+
+    mtime=0 keeps the archives identical across rebuilds. gzip.compress only
+    accepts mtime from Python 3.8, so go through GzipFile.
+    """
+    buffer = io.BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode='wb', compresslevel=9, mtime=0) as f:
+        f.write(data)
+    return buffer.getvalue()
 
 
 class WebsiteGenerator:
     """Generates a static website from puzzle JSON files."""
     
-    def __init__(self, puzzles_dir: str = "puzzles", output_dir: str = "website"):
+    # Text assets that get a .gz copy when precompressing
+    PRECOMPRESS_SUFFIXES = ('.html', '.css', '.js')
+    
+    def __init__(self, puzzles_dir: str = "puzzles", output_dir: str = "website",
+                 precompress: bool = False, force: bool = False, verbose: bool = True):
         self.puzzles_dir = Path(puzzles_dir)
         self.output_dir = Path(output_dir)
+        # Also write gzip copies for hosts that serve precompressed files
+        self.precompress = precompress
+        # Rebuild every puzzle page, even ones newer than their source
+        self.force = force
+        # Progress lines and the closing summary; errors always print
+        self.verbose = verbose
         self.puzzles = []
+        # Puzzle number -> modification time of its draft file
+        self._source_mtimes: Dict[int, float] = {}
+        # One timestamp per run so every page shows the same generation time
+        self.generated_at = datetime.now()
         
+    def _log(self, message: str) -> None:
+        """Print a progress message when verbose."""
+        if self.verbose:
+            print(message)
+    
     def load_puzzles(self) -> None:
         """Load all puzzle files from the puzzles directory."""
         if not self.puzzles_dir.exists():
             print(f"Puzzles directory {self.puzzles_dir} not found!")
             return
             
+        # The glob also matches names like web_x_draft.json; those are skipped
+        puzzle_files = []
         for puzzle_file in self.puzzles_dir.glob("web_*_draft.json"):
-            try:
-                with open(puzzle_file, 'r') as f:
-                    puzzle_data = json.load(f)
-                    puzzle_number = puzzle_file.stem.split('_')[1]  # Extract number from filename
-                    puzzle_data['puzzle_number'] = int(puzzle_number)
-                    self.puzzles.append(puzzle_data)
-                    print(f"Loaded puzzle {puzzle_number}")
-            except Exception as e:
-                print(f"Error loading {puzzle_file}: {e}")
+            puzzle_number = parse_puzzle_number(puzzle_file.name)
+            if puzzle_number is not None:
+                puzzle_files.append((puzzle_file, puzzle_number))
+        
+        # Reads overlap across threads; results are collected in glob order
+        with ThreadPoolExecutor() as executor:
+            futures = [executor.submit(self._load_puzzle_file, puzzle_file, puzzle_number)
+                       for puzzle_file, puzzle_number in puzzle_files]
+            for (puzzle_file, _), future in zip(puzzle_files, futures):
+                try:
+                    puzzle_data, mtime = future.result()
+                except Exception as e:
+                    print(f"Error loading {puzzle_file}: {e}")
+                    continue
+                self.puzzles.append(puzzle_data)
+                self._source_mtimes[puzzle_data['puzzle_number']] = mtime
+                self._log(f"Loaded puzzle {puzzle_data['puzzle_number']}")
                 
         self.puzzles.sort(key=lambda x: x['puzzle_number'])
-        print(f"Loaded {len(self.puzzles)} puzzles")
+        self._log(f"Loaded {len(self.puzzles)} puzzles")
+    
+    @staticmethod
+    def _load_puzzle_file(puzzle_file: Path, puzzle_number: int) -> Tuple[Dict[str, Any], float]:
+        """Read one puzzle file, tag it with its number, and return it with its mtime."""
+        mtime = puzzle_file.stat().st_mtime
+        # Whole-file read on purpose: puzzle files are a few KB, and
+        # streaming parsers are much slower than one loads() at that size
+        puzzle_data = load_json_bytes(puzzle_file.read_bytes())
+        puzzle_data['puzzle_number'] = puzzle_number
+        return puzzle_data, mtime
     
     def generate_index_html(self) -> str:
         """Generate the main index.html page."""
@@ -89,7 +192,7 @@ class WebsiteGenerator:
         </main>
         
         <footer>
-            <p>&copy; {datetime.now().year} SpydirWebz - Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+            <p>&copy; {self.generated_at.year} SpydirWebz - Generated on {self.generated_at.strftime('%Y-%m-%d %H:%M:%S')}</p>
         </footer>
     </div>
     
@@ -101,12 +204,13 @@ class WebsiteGenerator:
         """Generate HTML for puzzle cards."""
         cards = []
         for puzzle in self.puzzles:
-            difficulty_class = puzzle.get('difficulty', 'medium').lower()
+            difficulty = puzzle.get('difficulty', 'medium')
+            difficulty_class = escape(difficulty.lower())
             cards.append(f"""
                 <div class="puzzle-card {difficulty_class}">
                     <h3>Puzzle #{puzzle['puzzle_number']}</h3>
-                    <div class="difficulty-badge {difficulty_class}">{puzzle.get('difficulty', 'medium').title()}</div>
-                    <p class="author">by {puzzle.get('author', 'Unknown')}</p>
+                    <div class="difficulty-badge {difficulty_class}">{escape(difficulty.title())}</div>
+                    <p class="author">by {escape(puzzle.get('author', 'Unknown'))}</p>
                     <div class="puzzle-stats">
                         <span>🎭 {len(puzzle.get('actors', []))} Actors</span>
                         <span>⚔️ {len(puzzle.get('vectors', []))} Vectors</span>
@@ -121,6 +225,24 @@ class WebsiteGenerator:
     def generate_puzzle_page(self, puzzle: Dict[str, Any]) -> str:
         """Generate an individual puzzle page with Murdle-inspired design."""
         puzzle_num = puzzle['puzzle_number']
+        # Bind fields once; the grid below refers to them dozens of times
+        difficulty = puzzle.get('difficulty', 'medium')
+        actors = puzzle.get('actors', [])
+        vectors = puzzle.get('vectors', [])
+        assets = puzzle.get('assets', [])
+        stolen_data = puzzle.get('stolen_data', [])
+        clues = puzzle.get('clues', [])
+        actor_letters = self._grid_letters(actors)
+        vector_letters = self._grid_letters(vectors)
+        asset_letters = self._grid_letters(assets)
+        # HTML-escape puzzle text once; the grid, lists and selects reuse it
+        author = escape(puzzle.get('author', 'Unknown'))
+        difficulty_class = escape(difficulty.lower())
+        difficulty_label = escape(difficulty.title())
+        actors, vectors, assets, stolen_data = (
+            [escape(item) for item in items] for items in (actors, vectors, assets, stolen_data))
+        # Keep "</script>" inside string values from closing the script block
+        puzzle_json = dump_json_str(puzzle).replace('</', '<\\/')
         
         return f"""<!DOCTYPE html>
 <html lang="en">
@@ -137,8 +259,8 @@ class WebsiteGenerator:
             <a href="index.html" class="back-link">← Back to Puzzles</a>
             <h1>Puzzle #{puzzle_num}</h1>
             <div class="puzzle-meta">
-                <span class="difficulty-badge {puzzle.get('difficulty', 'medium').lower()}">{puzzle.get('difficulty', 'medium').title()}</span>
-                <span class="author">by {puzzle.get('author', 'Unknown')}</span>
+                <span class="difficulty-badge {difficulty_class}">{difficulty_label}</span>
+                <span class="author">by {author}</span>
             </div>
         </header>
         
@@ -155,75 +277,23 @@ class WebsiteGenerator:
                             <div class="grid-section top-left">
                                 <div class="grid-header-row">
                                     <div class="corner-cell"></div>
-                                    <div class="header-cell actor-header">{self._get_element_letter(puzzle.get('actors', [])[0]) if len(puzzle.get('actors', [])) > 0 else 'A'}</div>
-                                    <div class="header-cell actor-header">{self._get_element_letter(puzzle.get('actors', [])[1]) if len(puzzle.get('actors', [])) > 1 else 'B'}</div>
-                                    <div class="header-cell actor-header">{self._get_element_letter(puzzle.get('actors', [])[2]) if len(puzzle.get('actors', [])) > 2 else 'C'}</div>
-                                </div>
-                                <div class="grid-row">
-                                    <div class="header-cell vector-header">{self._get_element_letter(puzzle.get('vectors', [])[0]) if len(puzzle.get('vectors', [])) > 0 else 'X'}</div>
-                                    <div class="grid-cell" data-actor="{puzzle.get('actors', [])[0]}" data-vector="{puzzle.get('vectors', [])[0]}"></div>
-                                    <div class="grid-cell" data-actor="{puzzle.get('actors', [])[1]}" data-vector="{puzzle.get('vectors', [])[0]}"></div>
-                                    <div class="grid-cell" data-actor="{puzzle.get('actors', [])[2]}" data-vector="{puzzle.get('vectors', [])[0]}"></div>
-                                </div>
-                                <div class="grid-row">
-                                    <div class="header-cell vector-header">{self._get_element_letter(puzzle.get('vectors', [])[1]) if len(puzzle.get('vectors', [])) > 1 else 'Y'}</div>
-                                    <div class="grid-cell" data-actor="{puzzle.get('actors', [])[0]}" data-vector="{puzzle.get('vectors', [])[1]}"></div>
-                                    <div class="grid-cell" data-actor="{puzzle.get('actors', [])[1]}" data-vector="{puzzle.get('vectors', [])[1]}"></div>
-                                    <div class="grid-cell" data-actor="{puzzle.get('actors', [])[2]}" data-vector="{puzzle.get('vectors', [])[1]}"></div>
-                                </div>
-                                <div class="grid-row">
-                                    <div class="header-cell vector-header">{self._get_element_letter(puzzle.get('vectors', [])[2]) if len(puzzle.get('vectors', [])) > 2 else 'Z'}</div>
-                                    <div class="grid-cell" data-actor="{puzzle.get('actors', [])[0]}" data-vector="{puzzle.get('vectors', [])[2]}"></div>
-                                    <div class="grid-cell" data-actor="{puzzle.get('actors', [])[1]}" data-vector="{puzzle.get('vectors', [])[2]}"></div>
-                                    <div class="grid-cell" data-actor="{puzzle.get('actors', [])[2]}" data-vector="{puzzle.get('vectors', [])[2]}"></div>
+{self._grid_header_cells(' ' * 36, 'actor-header', actor_letters)}
                                 </div>
+{self._grid_rows(' ' * 32, 'actor', actors, 'vector', vectors, 'vector-header', vector_letters)}
                             </div>
                             
                             <!-- Top-right: Assets vs Actors -->
                             <div class="grid-section top-right">
                                 <div class="grid-header-row">
-                                    <div class="header-cell actor-header">{self._get_element_letter(puzzle.get('actors', [])[0]) if len(puzzle.get('actors', [])) > 0 else 'A'}</div>
-                                    <div class="header-cell actor-header">{self._get_element_letter(puzzle.get('actors', [])[1]) if len(puzzle.get('actors', [])) > 1 else 'B'}</div>
-                                    <div class="header-cell actor-header">{self._get_element_letter(puzzle.get('actors', [])[2]) if len(puzzle.get('actors', [])) > 2 else 'C'}</div>
-                                </div>
-                                <div class="grid-row">
-                                    <div class="grid-cell" data-actor="{puzzle.get('actors', [])[0]}" data-asset="{puzzle.get('assets', [])[0]}"></div>
-                                    <div class="grid-cell" data-actor="{puzzle.get('actors', [])[1]}" data-asset="{puzzle.get('assets', [])[0]}"></div>
-                                    <div class="grid-cell" data-actor="{puzzle.get('actors', [])[2]}" data-asset="{puzzle.get('assets', [])[0]}"></div>
-                                </div>
-                                <div class="grid-row">
-                                    <div class="grid-cell" data-actor="{puzzle.get('actors', [])[0]}" data-asset="{puzzle.get('assets', [])[1]}"></div>
-                                    <div class="grid-cell" data-actor="{puzzle.get('actors', [])[1]}" data-asset="{puzzle.get('assets', [])[1]}"></div>
-                                    <div class="grid-cell" data-actor="{puzzle.get('actors', [])[2]}" data-asset="{puzzle.get('assets', [])[1]}"></div>
-                                </div>
-                                <div class="grid-row">
-                                    <div class="grid-cell" data-actor="{puzzle.get('actors', [])[0]}" data-asset="{puzzle.get('assets', [])[2]}"></div>
-                                    <div class="grid-cell" data-actor="{puzzle.get('actors', [])[1]}" data-asset="{puzzle.get('assets', [])[2]}"></div>
-                                    <div class="grid-cell" data-actor="{puzzle.get('actors', [])[2]}" data-asset="{puzzle.get('assets', [])[2]}"></div>
+{self._grid_header_cells(' ' * 36, 'actor-header', actor_letters)}
                                 </div>
+{self._grid_rows(' ' * 32, 'actor', actors, 'asset', assets)}
                             </div>
                         </div>
                         
                         <!-- Bottom: Assets vs Vectors -->
                         <div class="grid-section bottom">
-                            <div class="grid-row">
-                                <div class="header-cell asset-header">{self._get_element_letter(puzzle.get('assets', [])[0]) if len(puzzle.get('assets', [])) > 0 else 'P'}</div>
-                                <div class="grid-cell" data-vector="{puzzle.get('vectors', [])[0]}" data-asset="{puzzle.get('assets', [])[0]}"></div>
-                                <div class="grid-cell" data-vector="{puzzle.get('vectors', [])[1]}" data-asset="{puzzle.get('assets', [])[0]}"></div>
-                                <div class="grid-cell" data-vector="{puzzle.get('vectors', [])[2]}" data-asset="{puzzle.get('assets', [])[0]}"></div>
-                            </div>
-                            <div class="grid-row">
-                                <div class="header-cell asset-header">{self._get_element_letter(puzzle.get('assets', [])[1]) if len(puzzle.get('assets', [])) > 1 else 'Q'}</div>
-                                <div class="grid-cell" data-vector="{puzzle.get('vectors', [])[0]}" data-asset="{puzzle.get('assets', [])[1]}"></div>
-                                <div class="grid-cell" data-vector="{puzzle.get('vectors', [])[1]}" data-asset="{puzzle.get('assets', [])[1]}"></div>
-                                <div class="grid-cell" data-vector="{puzzle.get('vectors', [])[2]}" data-asset="{puzzle.get('assets', [])[1]}"></div>
-                            </div>
-                            <div class="grid-row">
-                                <div class="header-cell asset-header">{self._get_element_letter(puzzle.get('assets', [])[2]) if len(puzzle.get('assets', [])) > 2 else 'R'}</div>
-                                <div class="grid-cell" data-vector="{puzzle.get('vectors', [])[0]}" data-asset="{puzzle.get('assets', [])[2]}"></div>
-                                <div class="grid-cell" data-vector="{puzzle.get('vectors', [])[1]}" data-asset="{puzzle.get('assets', [])[2]}"></div>
-                                <div class="grid-cell" data-vector="{puzzle.get('vectors', [])[2]}" data-asset="{puzzle.get('assets', [])[2]}"></div>
-                            </div>
+{self._grid_rows(' ' * 28, 'vector', vectors, 'asset', assets, 'asset-header', asset_letters)}
                         </div>
                     </div>
                 </div>
@@ -234,28 +304,28 @@ class WebsiteGenerator:
                 <div class="element-category">
                     <h3>WHO?</h3>
                     <div class="element-list">
-                        {self._generate_element_list(puzzle.get('actors', []))}
+                        {self._generate_element_list(actors)}
                     </div>
                 </div>
                 
                 <div class="element-category">
                     <h3>HOW?</h3>
                     <div class="element-list">
-                        {self._generate_element_list(puzzle.get('vectors', []))}
+                        {self._generate_element_list(vectors)}
                     </div>
                 </div>
                 
                 <div class="element-category">
                     <h3>WHERE?</h3>
                     <div class="element-list">
-                        {self._generate_element_list(puzzle.get('assets', []))}
+                        {self._generate_element_list(assets)}
                     </div>
                 </div>
                 
                 <div class="element-category">
                     <h3>WHY?</h3>
                     <div class="element-list">
-                        {self._generate_element_list(puzzle.get('stolen_data', []))}
+                        {self._generate_element_list(stolen_data)}
                     </div>
                 </div>
             </div>
@@ -264,7 +334,7 @@ class WebsiteGenerator:
             <div class="clues-section">
                 <h2>Clues</h2>
                 <div class="clues-list">
-                    {self._generate_clues_list(puzzle.get('clues', []))}
+                    {self._generate_clues_list(clues)}
                 </div>
             </div>
             
@@ -276,28 +346,28 @@ class WebsiteGenerator:
                         <label>WHO?</label>
                         <select id="solution-actor">
                             <option value="">Select actor...</option>
-                            {self._generate_select_options(puzzle.get('actors', []))}
+                            {self._generate_select_options(actors)}
                         </select>
                     </div>
                     <div class="solution-row">
                         <label>HOW?</label>
                         <select id="solution-vector">
                             <option value="">Select vector...</option>
-                            {self._generate_select_options(puzzle.get('vectors', []))}
+                            {self._generate_select_options(vectors)}
                         </select>
                     </div>
                     <div class="solution-row">
                         <label>WHERE?</label>
                         <select id="solution-asset">
                             <option value="">Select asset...</option>
-                            {self._generate_select_options(puzzle.get('assets', []))}
+                            {self._generate_select_options(assets)}
                         </select>
                     </div>
                     <div class="solution-row">
                         <label>WHY?</label>
                         <select id="solution-data">
                             <option value="">Select data...</option>
-                            {self._generate_select_options(puzzle.get('stolen_data', []))}
+                            {self._generate_select_options(stolen_data)}
                         </select>
                     </div>
                     <button id="check-solution" class="check-button">Check Solution</button>
@@ -307,42 +377,66 @@ class WebsiteGenerator:
         </main>
         
         <footer>
-            <p>&copy; {datetime.now().year} SpydirWebz</p>
+            <p>&copy; {self.generated_at.year} SpydirWebz</p>
         </footer>
     </div>
     
     <script>
         // Embed puzzle data for JavaScript
-        const puzzleData = {json.dumps(puzzle)};
+        const puzzleData = {puzzle_json};
     </script>
     <script src="puzzle-script.js"></script>
 </body>
 </html>"""
     
     def _generate_element_list(self, elements: List[str]) -> str:
-        """Generate HTML for element lists."""
+        """Generate HTML for element lists from already-escaped elements."""
         return '\n'.join([f'<div class="element">{element}</div>' for element in elements])
     
     def _generate_select_options(self, elements: List[str]) -> str:
-        """Generate HTML for select options."""
+        """Generate HTML for select options from already-escaped elements."""
         return '\n'.join([f'<option value="{element}">{element}</option>' for element in elements])
     
     def _generate_clues_list(self, clues: List[Dict[str, str]]) -> str:
         """Generate HTML for clues list."""
         clues_html = []
         for i, clue in enumerate(clues, 1):
-            clue_type = clue.get('type', 'unknown').title()
+            clue_type = escape(clue.get('type', 'unknown').title())
             clues_html.append(f"""
                 <div class="clue">
                     <div class="clue-header">
                         <span class="clue-number">#{i}</span>
                         <span class="clue-type">{clue_type}</span>
                     </div>
-                    <div class="clue-text">{clue.get('text', '')}</div>
+                    <div class="clue-text">{escape(clue.get('text', ''))}</div>
                 </div>
             """)
         return '\n'.join(clues_html)
     
+    def _grid_header_cells(self, indent: str, header_class: str, letters: List[str]) -> str:
+        """Generate one header cell per element letter."""
+        return '\n'.join(f'{indent}<div class="header-cell {header_class}">{letter}</div>'
+                         for letter in letters)
+    
+    def _grid_rows(self, indent: str, col_attr: str, cols: List[str], row_attr: str,
+                   rows: List[str], header_class: str = '',
+                   header_letters: Optional[List[str]] = None) -> str:
+        """Generate the rows of one grid section, one cell per column element."""
+        lines = []
+        for r, row in enumerate(rows):
+            lines.append(f'{indent}<div class="grid-row">')
+            if header_class:
+                lines.append(f'{indent}    <div class="header-cell {header_class}">{header_letters[r]}</div>')
+            for col in cols:
+                lines.append(f'{indent}    <div class="grid-cell" data-{col_attr}="{col}" '
+                             f'data-{row_attr}="{row}"></div>')
+            lines.append(f'{indent}</div>')
+        return '\n'.join(lines)
+    
+    def _grid_letters(self, elements: List[str]) -> List[str]:
+        """Escaped header letters for one grid axis."""
+        return [escape(self._get_element_letter(element)) for element in elements]
+    
     def _get_element_letter(self, element: str) -> str:
         """Get the first letter of an element for grid display."""
         if not element:
@@ -1009,7 +1103,8 @@ document.addEventListener('DOMContentLoaded', function() {
     
     def generate_website(self) -> None:
         """Generate the complete website."""
-        print("Generating SpydirWebz website...")
+        self._log("Generating SpydirWebz website...")
+        self.generated_at = datetime.now()
         
         # Load puzzles
         self.load_puzzles()
@@ -1022,42 +1117,46 @@ document.addEventListener('DOMContentLoaded', function() {
         self.output_dir.mkdir(exist_ok=True)
         
         # Generate main index page
-        index_html = self.generate_index_html()
-        with open(self.output_dir / "index.html", 'w', encoding='utf-8') as f:
-            f.write(index_html)
-        print("Generated index.html")
+        self._write_output("index.html", self.generate_index_html())
+        self._log("Generated index.html")
         
-        # Generate individual puzzle pages
+        # Generate individual puzzle pages, skipping ones that are up to date
+        generator_mtime = Path(__file__).stat().st_mtime
+        skipped = 0
         for puzzle in self.puzzles:
-            puzzle_html = self.generate_puzzle_page(puzzle)
             puzzle_filename = f"puzzle_{puzzle['puzzle_number']}.html"
-            with open(self.output_dir / puzzle_filename, 'w', encoding='utf-8') as f:
-                f.write(puzzle_html)
-            print(f"Generated {puzzle_filename}")
-        
-        # Generate CSS
-        css_content = self.generate_css()
-        with open(self.output_dir / "styles.css", 'w', encoding='utf-8') as f:
-            f.write(css_content)
-        print("Generated styles.css")
+            source_mtime = max(self._source_mtimes.get(puzzle['puzzle_number'], float('inf')),
+                               generator_mtime)
+            if not self.force and self._is_up_to_date(puzzle_filename, source_mtime):
+                skipped += 1
+                continue
+            self._write_output(puzzle_filename, self.generate_puzzle_page(puzzle))
+            self._log(f"Generated {puzzle_filename}")
+        if skipped:
+            self._log(f"Skipped {skipped} unchanged puzzle pages (use --force to rebuild)")
         
-        # Generate JavaScript files
-        js_content = self.generate_js()
-        with open(self.output_dir / "script.js", 'w', encoding='utf-8') as f:
-            f.write(js_content)
-        print("Generated script.js")
-        
-        puzzle_js_content = self.generate_puzzle_js()
-        with open(self.output_dir / "puzzle-script.js", 'w', encoding='utf-8') as f:
-            f.write(puzzle_js_content)
-        print("Generated puzzle-script.js")
+        # Generate CSS and JavaScript; they only change when this module does
+        static_files = [
+            ("styles.css", self.generate_css),
+            ("script.js", self.generate_js),
+            ("puzzle-script.js", self.generate_puzzle_js),
+        ]
+        for filename, generate in static_files:
+            if not self.force and self._is_up_to_date(filename, generator_mtime):
+                self._log(f"Unchanged {filename}")
+                continue
+            self._write_output(filename, generate())
+            self._log(f"Generated {filename}")
         
         # Generate README for the website
-        readme_content = self.generate_website_readme()
-        with open(self.output_dir / "README.md", 'w', encoding='utf-8') as f:
-            f.write(readme_content)
-        print("Generated README.md")
+        self._write_output("README.md", self.generate_website_readme())
+        self._log("Generated README.md")
         
+        if self.verbose:
+            self._print_summary()
+    
+    def _print_summary(self) -> None:
+        """Print the list of generated files and deployment steps."""
         print(f"\nWebsite generated successfully in {self.output_dir}/")
         print("Files created:")
         print(f"   - index.html (main page)")
@@ -1066,11 +1165,41 @@ document.addEventListener('DOMContentLoaded', function() {
         print(f"   - script.js (main JavaScript)")
         print(f"   - puzzle-script.js (puzzle logic)")
         print(f"   - README.md (deployment guide)")
+        if self.precompress:
+            print(f"   - *.gz (precompressed copies of HTML, CSS and JS)")
         print("\nTo deploy:")
         print("   1. Push the website/ directory to GitHub")
         print("   2. Enable GitHub Pages in repository settings")
         print("   3. Your site will be available at: https://yourusername.github.io/reponame/")
     
+    def _is_up_to_date(self, filename: str, source_mtime: float) -> bool:
+        """Check whether an output file (and its .gz copy, if wanted) is newer than its source."""
+        path = self.output_dir / filename
+        outputs = [path]
+        if self.precompress and path.suffix in self.PRECOMPRESS_SUFFIXES:
+            outputs.append(path.with_name(filename + '.gz'))
+        try:
+            return all(output.stat().st_mtime >= source_mtime for output in outputs)
+        except FileNotFoundError:
+            return False
+    
+    def _write_output(self, filename: str, content: str) -> None:
+        """Write one generated file, plus a .gz copy when precompressing.
+
+        Without precompression any .gz left by an earlier build is removed,
+        so gzip_static never serves an outdated copy of the file.
+        """
+        path = self.output_dir / filename
+        write_file_atomic(path, content)
+        gz_path = path.with_name(filename + '.gz')
+        if self.precompress and path.suffix in self.PRECOMPRESS_SUFFIXES:
+            write_file_atomic(gz_path, gzip_bytes(content.encode('utf-8')))
+        else:
+            try:
+                gz_path.unlink()
+            except FileNotFoundError:
+                pass
+    
     def generate_website_readme(self) -> str:
         """Generate a README for the website directory."""
         return f"""# SpydirWebz Website
@@ -1129,15 +1258,23 @@ This is a static website with:
 - ✅ No user data collection
 - ✅ Client-side puzzle validation only
 
-Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+Generated on: {self.generated_at.strftime('%Y-%m-%d %H:%M:%S')}
 """
 
 
-def main():
+def main(precompress: bool = False, force: bool = False, verbose: bool = True):
     """Main function to generate the website."""
-    generator = WebsiteGenerator()
+    generator = WebsiteGenerator(precompress=precompress, force=force, verbose=verbose)
     generator.generate_website()
 
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Generate the static SpydirWebz website.")
+    parser.add_argument("--gzip", action="store_true",
+                        help="also write precompressed .gz copies of HTML, CSS and JS files")
+    parser.add_argument("--force", action="store_true",
+                        help="rebuild every puzzle page, even if it is newer than its puzzle file")
+    parser.add_argument("--quiet", action="store_true",
+                        help="only print errors, not progress or the deployment summary")
+    args = parser.parse_args()
+    main(precompress=args.gzip, force=args.force, verbose=not args.quiet) 
\ No newline at end of file